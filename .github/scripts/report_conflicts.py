@@ -1,23 +1,56 @@
+import os
 import pathlib
 import re
 import subprocess
 import sys
 import textwrap
 
+# Grab <<<<<<< … ======= … >>>>>>> blocks with a bit of context around
+CONFLICT_RE = re.compile(
+    r"<<<<<<<[^\n]*\n(.*?)\n=======[^\n]*\n(.*?)\n>>>>>>>[^\n]*\n", re.S
+)
+
+# Skip files too large or too binary-looking to be worth a DOTALL scan
+MAX_SCAN_BYTES = 1 << 20
+SNIFF_BYTES = 8192
+
+
+def sh(argv):
+    """Run argv directly (no intermediate /bin/sh) and capture its output."""
+    return subprocess.run(argv, check=False, capture_output=True, text=True)
 
-def sh(cmd):
-    return subprocess.run(cmd, shell=True, check=False, capture_output=True, text=True)
+
+def unmerged_paths():
+    """Return conflicted paths (index stage 1/2/3 present), sorted and unique."""
+    out = sh(["git", "ls-files", "-u", "-z"]).stdout
+    paths = set()
+    for entry in out.split("\0"):
+        if entry:
+            # "<mode> <sha> <stage>\t<path>" - one entry per stage
+            paths.add(entry.partition("\t")[2])
+    return sorted(paths)
 
 
 # Collect conflicted files (index stage 1/2/3 present)
-files = sh("git ls-files -u | cut -f2 | sort -u").stdout.strip().splitlines()
-files = [f for f in files if f]
+files = unmerged_paths()
 
 if not files:
     print("::set-output name=body::No conflicts found.")
     sys.exit(0)
 
 
+def is_text_source(path):
+    """Cheap pre-check so lock files and binaries never reach the regex."""
+    p = pathlib.Path(path)
+    try:
+        if p.stat().st_size > MAX_SCAN_BYTES:
+            return False
+        with p.open("rb") as fh:
+            return b"\x00" not in fh.read(SNIFF_BYTES)
+    except OSError:
+        return False
+
+
 def extract_conflicts(path):
     p = pathlib.Path(path)
     try:
@@ -25,49 +58,51 @@ def extract_conflicts(path):
     except Exception:
         return []
     blocks = []
-    # Grab <<<<<<< … ======= … >>>>>>> blocks with a bit of context around
-    pattern = re.compile(
-        r"<<<<<<<[^\n]*\n(.*?)\n=======[^\n]*\n(.*?)\n>>>>>>>[^\n]*\n", re.S
-    )
-    for m in pattern.finditer(t):
+    for m in CONFLICT_RE.finditer(t):
         ours, theirs = m.group(1).rstrip(), m.group(2).rstrip()
         blocks.append((ours, theires := theirs))
     return blocks
 
 
-comment = []
-comment.append("### ⚠️ Merge conflicts detected\n")
-comment.append(
-    "The following files have conflicts. Each block shows `OURS` vs `THEIRS`.\n"
-)
-comment.append(
-    "Reply with **Suggested changes** for the merged result under each block.\n"
+MERGED_HINT = textwrap.dedent(
+    """\
+<!-- Replace the code block below with a GitHub Suggested Change
+that represents the correct merged content for this conflict. -->
+"""
 )
 
-for f in files:
-    comment.append(f"\n#### `{f}`\n")
-    blocks = extract_conflicts(f)
-    if not blocks:
-        comment.append("> (Conflict markers exist but couldn’t parse reliably.)\n")
-        continue
-    for i, (ours, theirs) in enumerate(blocks, 1):
-        comment.append(f"<details><summary>Conflict {i}</summary>\n\n")
-        comment.append("**OURS**:\n")
-        comment.append("```diff\n" + ours + "\n```\n")
-        comment.append("**THEIRS**:\n")
-        comment.append("```diff\n" + theirs + "\n```\n")
-        # Empty suggestion block the agent can fill in
-        merged_hint = textwrap.dedent(
-            """\
-        <!-- Replace the code block below with a GitHub Suggested Change
-        that represents the correct merged content for this conflict. -->
-        """
-        )
-        comment.append(merged_hint)
-        comment.append("</details>\n")
-
-body = "\n".join(comment)
-# GitHub Actions multiline output
-print(body)
-with open(os.environ.get("GITHUB_OUTPUT", "/tmp/out"), "a") as f:
-    f.write(f"body<<EOF\n{body}\nEOF\n")
+# GitHub Actions multiline output, streamed fragment by fragment so the
+# comment is never materialised as one string
+with open(os.environ.get("GITHUB_OUTPUT", "/tmp/out"), "a") as out:
+
+    def emit(fragment):
+        out.write(fragment)
+        out.write("\n")
+
+    out.write("body<<EOF\n")
+    emit("### ⚠️ Merge conflicts detected\n")
+    emit("The following files have conflicts. Each block shows `OURS` vs `THEIRS`.\n")
+    emit("Reply with **Suggested changes** for the merged result under each block.\n")
+
+    for f in files:
+        emit(f"\n#### `{f}`\n")
+        if not is_text_source(f):
+            emit("> (Binary or oversize file; conflict blocks not extracted.)\n")
+            continue
+        blocks = extract_conflicts(f)
+        if not blocks:
+            emit("> (Conflict markers exist but couldn’t parse reliably.)\n")
+            continue
+        for i, (ours, theirs) in enumerate(blocks, 1):
+            emit(f"<details><summary>Conflict {i}</summary>\n\n")
+            emit("**OURS**:\n")
+            emit("```diff\n" + ours + "\n```\n")
+            emit("**THEIRS**:\n")
+            emit("```diff\n" + theirs + "\n```\n")
+            # Empty suggestion block the agent can fill in
+            emit(MERGED_HINT)
+            emit("</details>\n")
+
+    out.write("EOF\n")
+
+print(f"Reported {len(files)} conflicted files")
@@ -1,11 +1,18 @@
 import json
-from typing import Sequence
+import os
+from functools import lru_cache
+from typing import Sequence, Tuple, Union
 
 from dotenv import load_dotenv
 from pydantic import AnyHttpUrl, Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-load_dotenv()
+# Set once .env has been applied so re-imports and forked workers skip it
+_DOTENV_SENTINEL = "_DOTENV_LOADED"
+
+if not os.environ.get(_DOTENV_SENTINEL):
+    load_dotenv()
+    os.environ[_DOTENV_SENTINEL] = "1"
 
 
 class Settings(BaseSettings):
@@ -41,8 +48,9 @@ class Settings(BaseSettings):
         default=30, validation_alias="JWT_REFRESH_TOKEN_EXPIRE_DAYS"
     )
 
-    # CORS
-    cors_origins: Sequence[str] = Field(
+    # CORS. Frozen to a tuple by the validator below; the str arm lets a
+    # plain comma-separated env value through instead of failing JSON decode
+    cors_origins: Union[Tuple[str, ...], str] = Field(
         default=("http://localhost:3000", "http://localhost:3456"),
         validation_alias="CORS_ORIGINS",
     )
@@ -52,6 +60,9 @@ class Settings(BaseSettings):
         default=100, validation_alias="RATE_LIMIT_REQUESTS"
     )
     rate_limit_period: int = Field(default=3600, validation_alias="RATE_LIMIT_PERIOD")
+    # Comma-separated peers allowed to set X-Forwarded-For; empty means the
+    # socket address is always used
+    trusted_proxies: str = Field(default="", validation_alias="TRUSTED_PROXIES")
 
     # OpenAI / SmartScope
     openai_api_key: SecretStr | None = Field(
@@ -69,6 +80,10 @@ class Settings(BaseSettings):
     smartscope_confidence_threshold: float = Field(
         default=0.75, validation_alias="SMARTSCOPE_CONFIDENCE_THRESHOLD"
     )
+    # Photos fetched and preprocessed concurrently per analysis
+    smartscope_fetch_concurrency: int = Field(
+        default=16, ge=1, validation_alias="SMARTSCOPE_FETCH_CONCURRENCY"
+    )
 
     @field_validator("cors_origins", mode="before")
     @classmethod
@@ -112,6 +127,12 @@ class Settings(BaseSettings):
             else None
         )
 
+    @property
+    def trusted_proxies_value(self) -> tuple[str, ...]:
+        return tuple(
+            proxy.strip() for proxy in self.trusted_proxies.split(",") if proxy.strip()
+        )
+
     @property
     def jwt_secret_key_value(self) -> str:
         return self.jwt_secret_key.get_secret_value()
@@ -125,4 +146,10 @@ class Settings(BaseSettings):
         )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, validated once on first use."""
+    return Settings()
+
+
+settings = get_settings()
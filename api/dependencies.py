@@ -1,30 +1,58 @@
 """Common dependencies for API endpoints."""
 
-from datetime import datetime
+import hashlib
 from typing import Optional
 from uuid import UUID
 
 from config import settings
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 from models.user import User
+from services.auth_cache import token_cache, token_key, ttl_until, user_cache
 from services.supabase import supabase_service
 
-security = HTTPBearer()
+# auto_error=False: a missing header becomes our own 401 below instead of
+# HTTPBearer's 403 exception path
+security = HTTPBearer(auto_error=False)
+
+# Only the user_profiles columns User is built from
+_USER_COLUMNS = (
+    "id,email,full_name,role,organization_id,is_active,created_at,updated_at"
+)
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
 ) -> User:
     """Get the current authenticated user from JWT token."""
+    # Already resolved earlier in this request, whatever the dependency path
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     token = credentials.credentials
+    cache_key = token_key(token)
 
     try:
-        # Decode JWT token
-        payload = jwt.decode(
-            token, settings.jwt_secret_key_value, algorithms=[settings.jwt_algorithm]
-        )
+        # Verify signature and exp once per token, then reuse the claims
+        payload = token_cache.get(cache_key)
+        if payload is None:
+            payload = jwt.decode(
+                token,
+                settings.jwt_secret_key_value,
+                algorithms=[settings.jwt_algorithm],
+                options={"require": ["exp", "sub"]},
+            )
+            token_cache.set(cache_key, payload, ttl_until(payload.get("exp")))
 
         # Extract user ID
         user_id = payload.get("sub")
@@ -34,41 +62,33 @@ async def get_current_user(
                 detail="Invalid token: missing user ID",
             )
 
-        # Check token expiration
-        exp = payload.get("exp")
-        if exp and datetime.fromtimestamp(exp) < datetime.now():
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired"
-            )
+        # Serve repeat requests for the same token from memory
+        cached_user = user_cache.get(cache_key)
+        if cached_user is not None:
+            request.state.user = cached_user
+            return cached_user
 
         # Get user from database
         supabase = supabase_service.client
-        result = supabase.table("user_profiles").select("*").eq("id", user_id).execute()
+        result = (
+            supabase.table("user_profiles")
+            .select(_USER_COLUMNS)
+            .eq("id", user_id)
+            .execute()
+        )
 
         if not result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
 
-        user_data = result.data[0]
-
-        # Create User model
-        return User(
-            id=UUID(user_data["id"]),
-            email=user_data["email"],
-            full_name=user_data.get("full_name"),
-            role=user_data["role"],
-            organization_id=(
-                UUID(user_data["organization_id"])
-                if user_data.get("organization_id")
-                else None
-            ),
-            is_active=user_data.get("is_active", True),
-            created_at=user_data["created_at"],
-            updated_at=user_data["updated_at"],
-        )
+        # pydantic-core parses the UUID/datetime strings directly
+        user = User.model_validate(result.data[0])
+        user_cache.set(cache_key, user, ttl_until(payload.get("exp")))
+        request.state.user = user
+        return user
 
-    except JWTError as e:
+    except InvalidTokenError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=f"Invalid token: {str(e)}"
         )
@@ -79,61 +99,89 @@ async def get_current_user(
         )
 
 
-async def get_current_active_user(
+class AuthContext:
+    """The authenticated caller for one request, with the common checks.
+
+    Routes that need several checks take a single ``Depends(get_auth_context)``
+    and call ``require``/``require_organization`` on it, so the whole auth
+    chain is one node in FastAPI's per-request dependency cache.
+    """
+
+    __slots__ = ("user",)
+
+    def __init__(self, user: User):
+        self.user = user
+
+    @property
+    def role(self) -> str:
+        return self.user.role
+
+    def require_active(self) -> User:
+        if not self.user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="User account is inactive"
+            )
+        return self.user
+
+    def require(self, *roles: str, detail: Optional[str] = None) -> User:
+        """Ensure the user is active and holds one of ``roles``."""
+        self.require_active()
+        if self.user.role not in roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail
+                or f"Requires one of the following roles: {', '.join(roles)}",
+            )
+        return self.user
+
+    def require_organization(self) -> UUID:
+        if not self.user.organization_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User is not associated with an organization",
+            )
+        return self.user.organization_id
+
+
+async def get_auth_context(
     current_user: User = Depends(get_current_user),
+) -> AuthContext:
+    """Resolve the caller once per request."""
+    return AuthContext(current_user)
+
+
+async def get_current_active_user(
+    ctx: AuthContext = Depends(get_auth_context),
 ) -> User:
     """Ensure the current user is active."""
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="User account is inactive"
-        )
-    return current_user
+    return ctx.require_active()
 
 
-async def get_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
-    """Ensure the current user is an admin."""
-    if current_user.role != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required"
-        )
-    return current_user
+async def get_admin_user(ctx: AuthContext = Depends(get_auth_context)) -> User:
+    """Ensure the current user is an admin. Prefer ``ctx.require("admin")``."""
+    return ctx.require("admin", detail="Admin privileges required")
 
 
-async def get_manager_user(
-    current_user: User = Depends(get_current_active_user),
-) -> User:
+async def get_manager_user(ctx: AuthContext = Depends(get_auth_context)) -> User:
     """Ensure the current user is at least a manager."""
-    if current_user.role not in ["admin", "manager"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Manager or admin privileges required",
-        )
-    return current_user
+    return ctx.require(
+        "admin", "manager", detail="Manager or admin privileges required"
+    )
 
 
-async def get_organization_id(current_user: User = Depends(get_current_user)) -> UUID:
+async def get_organization_id(ctx: AuthContext = Depends(get_auth_context)) -> UUID:
     """Get the organization ID for the current user."""
-    if not current_user.organization_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User is not associated with an organization",
-        )
-    return current_user.organization_id
+    return ctx.require_organization()
 
 
 class RoleChecker:
     """Dependency class for checking user roles."""
 
     def __init__(self, allowed_roles: list):
-        self.allowed_roles = allowed_roles
+        self.allowed_roles = tuple(allowed_roles)
 
-    def __call__(self, current_user: User = Depends(get_current_active_user)) -> User:
-        if current_user.role not in self.allowed_roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Requires one of the following roles: {', '.join(self.allowed_roles)}",
-            )
-        return current_user
+    async def __call__(self, ctx: AuthContext = Depends(get_auth_context)) -> User:
+        return ctx.require(*self.allowed_roles)
 
 
 # Role-based dependency instances
@@ -160,3 +208,22 @@ class PaginationParams:
         self.page = page
         self.per_page = per_page
         self.offset = (page - 1) * per_page
+
+
+async def get_pagination(page: int = 1, per_page: int = 20) -> PaginationParams:
+    """Pagination dependency; async so FastAPI skips the threadpool hop."""
+    return PaginationParams(page=page, per_page=per_page)
+
+
+def conditional_json(request: Request, body: bytes) -> Response:
+    """Wrap a serialized list page in a response carrying a weak ETag.
+
+    Pollers that send back a matching ``If-None-Match`` get an empty 304
+    instead of the page.
+    """
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
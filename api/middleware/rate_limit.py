@@ -1,97 +1,122 @@
-import asyncio
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Dict, Tuple
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Iterable, Tuple
 
-from fastapi import HTTPException, Request, status
+from config import settings
+from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
 
 class RateLimiter:
-    """Simple in-memory rate limiter"""
-
-    def __init__(self, requests: int = 100, period: int = 3600):
+    """Simple in-memory sliding-window rate limiter.
+
+    Each client keeps a deque of request timestamps, oldest first, so expiry
+    is a popleft loop over just the expired entries. Clients are kept in
+    least-recently-seen order, which lets idle ones be dropped from the
+    front without scanning everybody.
+    """
+
+    def __init__(
+        self,
+        requests: int = 100,
+        period: int = 3600,
+        trusted_proxies: Iterable[str] = (),
+    ):
         self.requests = requests
         self.period = period  # in seconds
-        self.clients: Dict[str, list] = defaultdict(list)
-        self._cleanup_task = None
+        self.trusted_proxies = frozenset(trusted_proxies)
+        # Timestamps are time.monotonic() floats, immune to wall-clock jumps
+        self.clients: "OrderedDict[str, Deque[float]]" = OrderedDict()
 
     def _get_client_id(self, request: Request) -> str:
         """Get client identifier from request"""
-        # Use IP address as client ID
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            client_ip = forwarded.split(",")[0]
-        else:
-            client_ip = request.client.host if request.client else "unknown"
-        return client_ip
-
-    def _cleanup_old_requests(self):
-        """Remove expired request timestamps"""
-        now = datetime.now()
-        cutoff = now - timedelta(seconds=self.period)
-
-        for client_id in list(self.clients.keys()):
-            self.clients[client_id] = [
-                timestamp for timestamp in self.clients[client_id] if timestamp > cutoff
-            ]
-            if not self.clients[client_id]:
-                del self.clients[client_id]
+        client_id = getattr(request.state, "client_id", None)
+        if client_id is not None:
+            return client_id
+
+        # Use IP address as client ID; X-Forwarded-For only counts when it
+        # was set by a proxy we trust, otherwise it is trivially spoofed
+        client_id = request.client.host if request.client else "unknown"
+        if client_id in self.trusted_proxies:
+            forwarded = request.headers.get("X-Forwarded-For")
+            if forwarded:
+                client_id = forwarded.partition(",")[0].strip()
+
+        request.state.client_id = client_id
+        return client_id
+
+    def _evict_idle_clients(self, cutoff: float) -> None:
+        """Drop clients whose newest request has fallen out of the window"""
+        while self.clients:
+            timestamps = next(iter(self.clients.values()))
+            if timestamps and timestamps[-1] > cutoff:
+                break
+            self.clients.popitem(last=False)
 
     async def check_rate_limit(self, request: Request) -> Tuple[bool, int]:
         """Check if request is within rate limit"""
         client_id = self._get_client_id(request)
-        now = datetime.now()
-
-        # Cleanup old requests periodically
-        self._cleanup_old_requests()
-
-        # Get request timestamps for this client
-        timestamps = self.clients[client_id]
+        now = time.monotonic()
+        cutoff = now - self.period
+
+        timestamps = self.clients.pop(client_id, None)
+        self._evict_idle_clients(cutoff)
+        if timestamps is None:
+            timestamps = deque()
+        # Most recently seen client goes to the back
+        self.clients[client_id] = timestamps
 
         # Remove old timestamps
-        cutoff = now - timedelta(seconds=self.period)
-        timestamps = [t for t in timestamps if t > cutoff]
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
         # Check if limit exceeded
         if len(timestamps) >= self.requests:
             # Calculate wait time
-            oldest = min(timestamps)
-            wait_time = int(
-                (oldest + timedelta(seconds=self.period) - now).total_seconds()
-            )
+            oldest = timestamps[0]
+            wait_time = int(oldest + self.period - now)
             return False, wait_time
 
         # Add current request
         timestamps.append(now)
-        self.clients[client_id] = timestamps
 
         return True, 0
 
 
+# Process-wide limiter shared by every request
+limiter = RateLimiter(
+    requests=settings.rate_limit_requests,
+    period=settings.rate_limit_period,
+    trusted_proxies=settings.trusted_proxies_value,
+)
+
+# Exact paths that are never rate limited, checked before the prefix test
+_SKIP_PATHS = frozenset({"/health", "/", "/docs", "/openapi.json", "/redoc"})
+_LIMITED_PREFIX = "/api/auth"
+
+
 async def rate_limit_middleware(request: Request, call_next):
     """Rate limiting middleware"""
-    # Skip rate limiting for health checks
-    if request.url.path in ["/health", "/", "/docs", "/openapi.json"]:
+    # Only auth endpoints are limited; everything else, including CORS
+    # preflights, passes straight through
+    path = request.url.path
+    if (
+        path in _SKIP_PATHS
+        or not path.startswith(_LIMITED_PREFIX)
+        or request.method == "OPTIONS"
+    ):
         return await call_next(request)
-    # Check rate limit for auth endpoints
-    if request.url.path.startswith("/api/auth"):
-        from ..config import settings
 
-        limiter = RateLimiter(
-            requests=settings.rate_limit_requests, period=settings.rate_limit_period
-        )
+    allowed, wait_time = await limiter.check_rate_limit(request)
 
-        allowed, wait_time = await limiter.check_rate_limit(request)
-
-        if not allowed:
-            return JSONResponse(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                content={
-                    "detail": f"Rate limit exceeded. Try again in {wait_time} seconds",
-                    "retry_after": wait_time,
-                },
-                headers={"Retry-After": str(wait_time)},
-            )
+    if not allowed:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={
+                "detail": f"Rate limit exceeded. Try again in {wait_time} seconds",
+                "retry_after": wait_time,
+            },
+            headers={"Retry-After": str(wait_time)},
+        )
 
     return await call_next(request)
@@ -0,0 +1,12 @@
+"""Field types shared across the API models."""
+
+from typing import Annotated
+
+from pydantic import Field
+
+# Optional leading +/1 followed by 9-15 digits
+PHONE_PATTERN = r"^\+?1?\d{9,15}$"
+
+PhoneStr = Annotated[str, Field(pattern=PHONE_PATTERN)]
+
+__all__ = ["PHONE_PATTERN", "PhoneStr"]
@@ -4,6 +4,22 @@ from typing import Literal, Optional
 
 from pydantic import BaseModel, EmailStr, Field, validator
 
+from ._shared import PhoneStr
+
+# Password character-class rules, compiled once and shared by both validators
+_PASSWORD_RULES = (
+    (re.compile(r"[A-Z]"), "Password must contain at least one uppercase letter"),
+    (re.compile(r"[a-z]"), "Password must contain at least one lowercase letter"),
+    (re.compile(r"\d"), "Password must contain at least one digit"),
+)
+
+
+def _check_password_strength(v: str) -> str:
+    for pattern, message in _PASSWORD_RULES:
+        if not pattern.search(v):
+            raise ValueError(message)
+    return v
+
 
 class UserType(str):
     PROPERTY_MANAGER = "property_manager"
@@ -17,20 +33,14 @@ class RegisterRequest(BaseModel):
     password: str = Field(..., min_length=8)
     user_type: Literal["property_manager", "contractor", "tenant"]
     full_name: str = Field(..., min_length=2, max_length=255)
-    phone: Optional[str] = Field(None, pattern=r"^\+?1?\d{9,15}$")
+    phone: Optional[PhoneStr] = None
     organization_name: Optional[str] = None
 
     @validator("password")
     def validate_password(cls, v):
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters")
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _check_password_strength(v)
 
     @validator("organization_name")
     def validate_organization(cls, v, values):
@@ -62,13 +72,7 @@ class NewPasswordRequest(BaseModel):
 
     @validator("new_password")
     def validate_password(cls, v):
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _check_password_strength(v)
 
 
 class UserResponse(BaseModel):
@@ -113,4 +117,4 @@ class UserProfileCreate(BaseModel):
     full_name: str
     user_type: str
     organization_id: Optional[str]
-    profile_data: Optional[dict] = {}
+    profile_data: dict = Field(default_factory=dict)
@@ -7,7 +7,34 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    field_validator,
+    model_validator,
+)
+
+from ._shared import PhoneStr
+
+_utcnow = datetime.utcnow
+_MAX_BID_WINDOW = timedelta(days=7)
+
+
+def _check_bid_deadline(value: datetime) -> datetime:
+    """Deadline must fall within the next seven days; reads the clock once."""
+    now = _utcnow()
+    if value <= now:
+        raise ValueError("Bid deadline must be in the future")
+    if value > now + _MAX_BID_WINDOW:
+        raise ValueError("Bid deadline cannot be more than 7 days out")
+    return value
+
+
+def _check_budget(budget_min: Optional[float], budget_max: Optional[float]) -> None:
+    if budget_min is not None and budget_max is not None and budget_min > budget_max:
+        raise ValueError("Minimum budget cannot exceed maximum budget")
 
 
 class ProjectCategory(str, Enum):
@@ -63,18 +90,15 @@ class VirtualAccessInfo(BaseModel):
     lockbox_code: Optional[str] = Field(None, max_length=50)
     key_location: Optional[str] = Field(None, max_length=255)
     onsite_contact_name: Optional[str] = Field(None, max_length=255)
-    onsite_contact_phone: Optional[str] = Field(
-        None,
-        pattern=r"^\+?1?\d{9,15}$",
-        description="International E.164 formatted phone number",
+    onsite_contact_phone: Optional[PhoneStr] = Field(
+        None, description="International E.164 formatted phone number"
     )
     parking_instructions: Optional[str] = Field(None, max_length=500)
     work_hours: Optional[str] = Field(None, max_length=255)
     hazards: Optional[str] = Field(None, max_length=500)
     pets_on_property: Optional[bool] = None
 
-    class Config:
-        anystr_strip_whitespace = True
+    model_config = ConfigDict(str_strip_whitespace=True)
 
 
 class ProjectBase(BaseModel):
@@ -102,20 +126,7 @@ class ProjectBase(BaseModel):
     @field_validator("bid_deadline")
     @classmethod
     def validate_bid_deadline(cls, value: datetime) -> datetime:
-        now = datetime.utcnow()
-        if value <= now:
-            raise ValueError("Bid deadline must be in the future")
-        max_deadline = now + timedelta(days=7)
-        if value > max_deadline:
-            raise ValueError("Bid deadline cannot be more than 7 days out")
-        return value
-
-    @field_validator("preferred_start_date", "completion_deadline", mode="before")
-    @classmethod
-    def parse_dates(cls, value):
-        if isinstance(value, str):
-            return date.fromisoformat(value)
-        return value
+        return _check_bid_deadline(value)
 
     @model_validator(mode="after")
     def validate_dates(self) -> "ProjectBase":
@@ -123,7 +134,7 @@ class ProjectBase(BaseModel):
         completion = self.completion_deadline
         bid_deadline = self.bid_deadline
 
-        if preferred_start and preferred_start < datetime.utcnow().date():
+        if preferred_start and preferred_start < _utcnow().date():
             raise ValueError("Preferred start date cannot be in the past")
 
         if completion and preferred_start and completion < preferred_start:
@@ -132,15 +143,7 @@ class ProjectBase(BaseModel):
         if preferred_start and bid_deadline and bid_deadline.date() > preferred_start:
             raise ValueError("Bid deadline must be on or before preferred start date")
 
-        budget_min = self.budget_min
-        budget_max = self.budget_max
-        if (
-            budget_min is not None
-            and budget_max is not None
-            and budget_min > budget_max
-        ):
-            raise ValueError("Minimum budget cannot exceed maximum budget")
-
+        _check_budget(self.budget_min, self.budget_max)
         return self
 
 
@@ -176,30 +179,17 @@ class ProjectUpdate(BaseModel):
     special_conditions: Optional[str] = Field(None, max_length=1000)
     status: Optional[ProjectStatus] = None
 
-    @field_validator("bid_deadline")
-    @classmethod
-    def validate_optional_deadline(cls, value: datetime) -> datetime:
-        if value <= datetime.utcnow():
-            raise ValueError("Bid deadline must be in the future")
-        max_deadline = datetime.utcnow() + timedelta(days=7)
-        if value > max_deadline:
-            raise ValueError("Bid deadline cannot be more than 7 days out")
-        return value
-
     @model_validator(mode="after")
     def validate_budget_and_dates(self) -> "ProjectUpdate":
-        budget_min = self.budget_min
-        budget_max = self.budget_max
-        if (
-            budget_min is not None
-            and budget_max is not None
-            and budget_min > budget_max
-        ):
-            raise ValueError("Minimum budget cannot exceed maximum budget")
+        # Most PATCHes leave the deadline alone; only check it when sent.
+        if "bid_deadline" in self.model_fields_set and self.bid_deadline is not None:
+            _check_bid_deadline(self.bid_deadline)
+
+        _check_budget(self.budget_min, self.budget_max)
 
         preferred_start = self.preferred_start_date
         completion = self.completion_deadline
-        if preferred_start and preferred_start < datetime.utcnow().date():
+        if preferred_start and preferred_start < _utcnow().date():
             raise ValueError("Preferred start date cannot be in the past")
         if completion and preferred_start and completion < preferred_start:
             raise ValueError("Completion deadline must be after start date")
@@ -240,8 +230,7 @@ class Project(BaseModel):
     published_at: Optional[datetime]
     closed_at: Optional[datetime]
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
 
 
 class ProjectListResponse(BaseModel):
@@ -254,6 +243,8 @@ class ProjectListResponse(BaseModel):
     has_next: bool
     has_prev: bool
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ProjectFilter(BaseModel):
     """Filters that can be applied when listing projects."""
@@ -264,12 +255,16 @@ class ProjectFilter(BaseModel):
     urgency: Optional[ProjectUrgency] = None
     property_id: Optional[UUID] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ProjectStatusUpdate(BaseModel):
     """Request payload for status transitions."""
 
     status: ProjectStatus
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class ProjectPublishRequest(BaseModel):
     """Request payload when publishing a project."""
@@ -277,6 +272,8 @@ class ProjectPublishRequest(BaseModel):
     send_notifications: bool = True
     notify_email: Optional[EmailStr] = None
 
+    model_config = ConfigDict(defer_build=True)
+
 
 __all__ = [
     "BudgetRange",
@@ -6,7 +6,13 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Basic US ZIP / ZIP+4
+_ZIP_RE = re.compile(r"^\d{5}(-\d{4})?$")
+
+# Year at import; anything at or below it can skip the clock read
+_LOAD_YEAR = datetime.now().year
 
 
 class PropertyType(str, Enum):
@@ -42,9 +48,10 @@ class PropertyDetails(BaseModel):
     parking_spaces: Optional[int] = Field(None, ge=0, le=1000)
     lot_size: Optional[float] = Field(None, gt=0)
 
-    @validator("year_built")
+    @field_validator("year_built")
+    @classmethod
     def validate_year_built(cls, v):
-        if v and v > datetime.now().year:
+        if v and v > _LOAD_YEAR and v > datetime.now().year:
             raise ValueError("Year built cannot be in the future")
         return v
 
@@ -55,7 +62,7 @@ class PropertyPhoto(BaseModel):
     url: str
     caption: Optional[str] = None
     is_primary: bool = False
-    uploaded_at: datetime = Field(default_factory=datetime.now)
+    uploaded_at: Optional[datetime] = None
 
 
 class PropertyCoordinates(BaseModel):
@@ -82,26 +89,34 @@ class PropertyBase(BaseModel):
     coordinates: Optional[PropertyCoordinates] = None
     photos: List[PropertyPhoto] = Field(default_factory=list)
 
-    @validator("zip")
+    @field_validator("zip")
+    @classmethod
     def validate_zip(cls, v):
         # Basic US ZIP code validation
-        if not re.match(r"^\d{5}(-\d{4})?$", v):
+        if not _ZIP_RE.match(v):
             raise ValueError("Invalid ZIP code format")
         return v
 
-    @validator("amenities")
+    @field_validator("amenities")
+    @classmethod
     def validate_amenities(cls, v):
         # Limit amenities and ensure uniqueness
         if len(v) > 50:
             raise ValueError("Too many amenities (max 50)")
-        return list(set(v))  # Remove duplicates
+        return list(dict.fromkeys(v))  # Remove duplicates, keep order
 
-    @validator("photos")
+    @field_validator("photos")
+    @classmethod
     def validate_photos(cls, v):
-        # Ensure only one primary photo
-        primary_count = sum(1 for photo in v if photo.is_primary)
-        if primary_count > 1:
-            raise ValueError("Only one photo can be marked as primary")
+        # Ensure only one primary photo; a single photo can't conflict
+        if len(v) < 2:
+            return v
+        seen_primary = False
+        for photo in v:
+            if photo.is_primary:
+                if seen_primary:
+                    raise ValueError("Only one photo can be marked as primary")
+                seen_primary = True
         return v
 
 
@@ -138,8 +153,7 @@ class Property(PropertyBase):
     updated_at: datetime
     deleted_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, use_enum_values=True)
 
 
 class PropertyFilter(BaseModel):
@@ -159,21 +173,15 @@ class PropertyFilter(BaseModel):
     group_id: Optional[UUID] = None
     include_archived: bool = False
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PropertyBulkCreate(BaseModel):
     """Model for bulk property creation."""
 
-    properties: List[PropertyCreate]
+    properties: List[PropertyCreate] = Field(..., min_length=1, max_length=100)
     skip_duplicates: bool = True
 
-    @validator("properties")
-    def validate_property_count(cls, v):
-        if len(v) > 100:
-            raise ValueError("Cannot create more than 100 properties at once")
-        if len(v) == 0:
-            raise ValueError("At least one property is required")
-        return v
-
 
 class PropertyImport(BaseModel):
     """Model for property import."""
@@ -191,6 +199,8 @@ class PropertyExport(BaseModel):
     filters: Optional[PropertyFilter] = None
     include_deleted: bool = False
 
+    model_config = ConfigDict(defer_build=True)
+
 
 # Property Group Models
 
@@ -226,8 +236,7 @@ class PropertyGroup(PropertyGroupBase):
     updated_at: datetime
     property_count: int = 0
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PropertyGroupMemberAction(BaseModel):
@@ -235,13 +244,16 @@ class PropertyGroupMemberAction(BaseModel):
 
     property_ids: List[UUID]
 
-    @validator("property_ids")
+    @field_validator("property_ids")
+    @classmethod
     def validate_property_ids(cls, v):
+        # Remove duplicates (keeping order), then bound the unique count
+        v = list(dict.fromkeys(v))
         if len(v) > 100:
             raise ValueError("Cannot modify more than 100 properties at once")
         if len(v) == 0:
             raise ValueError("At least one property ID is required")
-        return list(set(v))  # Remove duplicates
+        return v
 
 
 # Response Models
@@ -257,6 +269,8 @@ class PropertyListResponse(BaseModel):
     has_next: bool
     has_prev: bool
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PropertyGroupListResponse(BaseModel):
     """Response for property group list endpoint."""
@@ -264,6 +278,8 @@ class PropertyGroupListResponse(BaseModel):
     groups: List[PropertyGroup]
     total: int
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PropertyBulkResponse(BaseModel):
     """Response for bulk operations."""
@@ -273,6 +289,8 @@ class PropertyBulkResponse(BaseModel):
     errors: List[Dict[str, Any]] = Field(default_factory=list)
     created_ids: List[UUID] = Field(default_factory=list)
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class PropertyImportResponse(BaseModel):
     """Response for import operations."""
@@ -282,3 +300,5 @@ class PropertyImportResponse(BaseModel):
     skipped: int
     errors: List[Dict[str, Any]] = Field(default_factory=list)
     preview: Optional[List[Property]] = None
+
+    model_config = ConfigDict(defer_build=True)
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, condecimal, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from ._shared import PhoneStr
 
 
 class QuoteSubmissionMethod(str, Enum):
@@ -30,7 +33,9 @@ class QuoteStatus(str, Enum):
     WITHDRAWN = "withdrawn"
 
 
-Currency = condecimal(max_digits=12, decimal_places=2, ge=0)
+Currency = Annotated[Decimal, Field(max_digits=12, decimal_places=2, ge=0)]
+Quantity = Annotated[Decimal, Field(max_digits=10, decimal_places=2, ge=0)]
+Confidence = Annotated[Decimal, Field(max_digits=3, decimal_places=2, ge=0, le=1)]
 
 
 class QuoteFormLineItem(BaseModel):
@@ -42,9 +47,7 @@ class QuoteFormLineItem(BaseModel):
         max_length=100,
         description="Standardized category label such as labor, materials, etc.",
     )
-    quantity: Optional[condecimal(max_digits=10, decimal_places=2, ge=0)] = Field(
-        1, description="Quantity of the item."
-    )
+    quantity: Optional[Quantity] = Field(1, description="Quantity of the item.")
     unit_of_measure: Optional[str] = Field(
         None,
         max_length=20,
@@ -110,6 +113,7 @@ class QuoteFormSubmission(BaseModel):
     )
     line_items: List[QuoteFormLineItem] = Field(
         default_factory=list,
+        max_length=100,
         description="Structured breakdown of the quote.",
     )
     contact_name: Optional[str] = Field(
@@ -120,21 +124,13 @@ class QuoteFormSubmission(BaseModel):
     contact_email: Optional[EmailStr] = Field(
         None, description="Email for the contractor representative."
     )
-    contact_phone: Optional[str] = Field(
-        None,
-        pattern=r"^\+?1?\d{9,15}$",
-        description="Phone number in E.164 format for easy dialing.",
+    contact_phone: Optional[PhoneStr] = Field(
+        None, description="Phone number in E.164 format for easy dialing."
     )
     is_draft: bool = Field(
         False, description="When true the submission should be stored as an editable draft."
     )
 
-    @validator("line_items")
-    def ensure_line_item_totals(cls, items: List[QuoteFormLineItem]) -> List[QuoteFormLineItem]:
-        if len(items) > 100:
-            raise ValueError("A quote cannot contain more than 100 line items")
-        return items
-
 
 class Quote(BaseModel):
     """Quote representation returned from the API."""
@@ -150,9 +146,7 @@ class Quote(BaseModel):
     materials_cost: Optional[Currency] = None
     other_costs: Optional[Currency] = None
     tax_amount: Optional[Currency] = None
-    confidence_score: Optional[condecimal(max_digits=3, decimal_places=2, ge=0, le=1)] = (
-        None
-    )
+    confidence_score: Optional[Confidence] = None
     can_start_date: Optional[date] = None
     estimated_duration_days: Optional[int] = None
     completion_date: Optional[date] = None
@@ -166,6 +160,8 @@ class Quote(BaseModel):
     standardized_data: dict
     line_items: List[QuoteFormLineItem] = Field(default_factory=list)
 
+    model_config = ConfigDict(frozen=True, use_enum_values=True)
+
 
 class QuoteSubmissionResponse(BaseModel):
     """Response payload for quote submission endpoints."""
@@ -176,6 +172,8 @@ class QuoteSubmissionResponse(BaseModel):
         description="Human friendly status message explaining the result of the submission.",
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 __all__ = [
     "Quote",
@@ -3,12 +3,39 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field, HttpUrl, field_validator
+from pydantic import (
+    AfterValidator,
+    AnyHttpUrl,
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+)
+
+# Validated as an http(s) URL at ingress, then kept as a plain str because
+# that is what downstream code and storage want
+_HttpUrlStr = Annotated[AnyHttpUrl, AfterValidator(str)]
 
 SMARTSCOPE_SEVERITIES = ("Emergency", "High", "Medium", "Low")
+_SEVERITY_SET = frozenset(SMARTSCOPE_SEVERITIES)
+_SEVERITY_CHOICES = ", ".join(sorted(SMARTSCOPE_SEVERITIES))
+# Canonical spellings of the categories SmartScope has templates for, keyed
+# by lower case; str.title() would turn "hvac" into "Hvac"
+_CATEGORY_CANONICAL = {
+    name.lower(): name
+    for name in (
+        "Plumbing",
+        "Electrical",
+        "HVAC",
+        "Roofing",
+        "Flooring",
+        "Appliances",
+        "General Maintenance",
+    )
+}
 SMARTSCOPE_SCOPE_ITEM_FIELDS = (
     "title",
     "description",
@@ -18,6 +45,15 @@ SMARTSCOPE_SCOPE_ITEM_FIELDS = (
     "estimated_hours",
 )
 SMARTSCOPE_MATERIAL_FIELDS = ("name", "quantity", "specifications")
+# Set and name->position views of the field tuples for O(1) lookups
+SMARTSCOPE_SCOPE_ITEM_FIELDSET = frozenset(SMARTSCOPE_SCOPE_ITEM_FIELDS)
+SMARTSCOPE_SCOPE_ITEM_INDEX = {
+    name: index for index, name in enumerate(SMARTSCOPE_SCOPE_ITEM_FIELDS)
+}
+SMARTSCOPE_MATERIAL_FIELDSET = frozenset(SMARTSCOPE_MATERIAL_FIELDS)
+SMARTSCOPE_MATERIAL_INDEX = {
+    name: index for index, name in enumerate(SMARTSCOPE_MATERIAL_FIELDS)
+}
 SMARTSCOPE_METADATA_FIELDS = (
     "processing_status",
     "model_version",
@@ -70,7 +106,7 @@ class AnalysisRequest(BaseModel):
     model_config = ConfigDict(extra="forbid", protected_namespaces=())
 
     project_id: UUID
-    photo_urls: List[AnyHttpUrl]
+    photo_urls: List[_HttpUrlStr] = Field(..., max_length=32)
     property_type: str = Field(..., description="Residential, Commercial, etc")
     area: str = Field(..., description="Location inside the property such as Kitchen")
     reported_issue: str = Field(
@@ -88,7 +124,8 @@ class AnalysisRequest(BaseModel):
     @field_validator("category")
     @classmethod
     def _normalise_category(cls, value: str) -> str:
-        return value.strip().title()
+        value = value.strip()
+        return _CATEGORY_CANONICAL.get(value.lower()) or value.title()
 
 
 class AnalysisMetadata(BaseModel):
@@ -111,7 +148,7 @@ class SmartScopeAnalysis(BaseModel):
 
     id: UUID
     project_id: UUID
-    photo_urls: List[HttpUrl]
+    photo_urls: List[str]
     primary_issue: str
     severity: str
     category: str
@@ -130,15 +167,19 @@ class SmartScopeAnalysis(BaseModel):
     @classmethod
     def _validate_severity(cls, value: str) -> str:
         severity = value.title()
-        if severity not in SMARTSCOPE_SEVERITIES:
+        if severity not in _SEVERITY_SET:
             raise ValueError(
-                f"Invalid severity '{value}'. Expected one of: {', '.join(sorted(SMARTSCOPE_SEVERITIES))}."
+                f"Invalid severity '{value}'. Expected one of: {_SEVERITY_CHOICES}."
             )
         return severity
 
 
 class SmartScopeAnalysisCreate(BaseModel):
-    """Internal helper model when persisting new analysis records."""
+    """Internal helper model when persisting new analysis records.
+
+    The analysis fields come straight from the model's JSON reply, so this
+    validation is what keeps a malformed reply out of the table.
+    """
 
     model_config = ConfigDict(extra="forbid", protected_namespaces=())
 
@@ -216,7 +257,11 @@ class AnalysisListResponse(BaseModel):
 __all__ = [
     "SMARTSCOPE_SEVERITIES",
     "SMARTSCOPE_SCOPE_ITEM_FIELDS",
+    "SMARTSCOPE_SCOPE_ITEM_FIELDSET",
+    "SMARTSCOPE_SCOPE_ITEM_INDEX",
     "SMARTSCOPE_MATERIAL_FIELDS",
+    "SMARTSCOPE_MATERIAL_FIELDSET",
+    "SMARTSCOPE_MATERIAL_INDEX",
     "SMARTSCOPE_METADATA_FIELDS",
     "ScopeItem",
     "MaterialItem",
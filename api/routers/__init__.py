@@ -1,5 +1,21 @@
-"""Router package exports."""
+"""Router package exports.
+
+Submodules are imported on first attribute access so importing the package
+does not build every router's models up front.
+"""
+
+import importlib
+from types import ModuleType
+
+_ROUTERS = ("auth", "projects", "properties", "quotes", "smartscope")
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _ROUTERS:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from . import auth, projects, properties, quotes, smartscope
 
 __all__ = ["auth", "properties", "projects", "quotes", "smartscope"]
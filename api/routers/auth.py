@@ -1,11 +1,12 @@
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from datetime import datetime
 
 from config import settings
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+import jwt
+from jwt import InvalidTokenError
+from pydantic import BaseModel
 from models.auth import (
     AuthResponse,
     LoginRequest,
@@ -20,20 +21,46 @@ from models.auth import (
     UserResponse,
     VerifyEmailRequest,
 )
+from services.auth_cache import (
+    SESSION_CACHE_MAX_TTL,
+    forget_token,
+    invalidate_user_cache,
+    profile_cache,
+    token_key,
+    ttl_until,
+)
 from services.supabase import supabase_service
 
 router = APIRouter()
-security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
+# Token lifetimes in seconds; JWT exp is a plain epoch timestamp
+_ACCESS_TOKEN_TTL = settings.jwt_access_token_expire_minutes * 60
+_REFRESH_TOKEN_TTL = settings.jwt_refresh_token_expire_days * 86400
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize an already-validated model without FastAPI revalidating it."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def _bearer_token(request: Request) -> str:
+    """Slice the token out of ``Authorization: Bearer <token>``, else 401."""
+    auth = request.headers.get("authorization", "")
+    token = auth[7:].strip()
+    if not token or auth[:7].lower() != "bearer ":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
+
 
 def create_access_token(data: dict) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(
-        minutes=settings.jwt_access_token_expire_minutes
-    )
-    to_encode.update({"exp": expire, "type": "access"})
+    to_encode.update({"exp": int(time.time()) + _ACCESS_TOKEN_TTL, "type": "access"})
     return jwt.encode(
         to_encode, settings.jwt_secret_key_value, algorithm=settings.jwt_algorithm
     )
@@ -42,18 +69,20 @@ def create_access_token(data: dict) -> str:
 def create_refresh_token(data: dict) -> str:
     """Create a JWT refresh token"""
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.jwt_refresh_token_expire_days)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": int(time.time()) + _REFRESH_TOKEN_TTL, "type": "refresh"})
     return jwt.encode(
         to_encode, settings.jwt_secret_key_value, algorithm=settings.jwt_algorithm
     )
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> UserResponse:
+async def get_current_user(request: Request) -> UserResponse:
     """Validate JWT token and return current user"""
-    token = credentials.credentials
+    token = _bearer_token(request)
+    key = token_key(token)
+    cached = profile_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
         payload = jwt.decode(
             token, settings.jwt_secret_key_value, algorithms=[settings.jwt_algorithm]
@@ -70,12 +99,18 @@ async def get_current_user(
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
             )
-        return UserResponse(**user)
-    except JWTError:
+        current_user = UserResponse(**user)
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         )
 
+    # Entries expire with the token, and sooner so revocations are noticed
+    profile_cache.set(
+        key, current_user, ttl_until(payload.get("exp"), SESSION_CACHE_MAX_TTL)
+    )
+    return current_user
+
 
 @router.post("/register", response_model=RegisterResponse)
 async def register(request: RegisterRequest):
@@ -184,11 +219,11 @@ async def login(request: LoginRequest):
         access_token = create_access_token({"sub": user.id, "email": user.email})
         refresh_token = create_refresh_token({"sub": user.id})
 
-        return AuthResponse(
+        auth = AuthResponse.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
-            expires_in=settings.jwt_access_token_expire_minutes * 60,
-            user=UserResponse(
+            expires_in=_ACCESS_TOKEN_TTL,
+            user=UserResponse.model_construct(
                 id=user.id,
                 email=user.email,
                 full_name=profile["full_name"],
@@ -196,9 +231,10 @@ async def login(request: LoginRequest):
                 organization_id=profile["organization_id"],
                 email_verified=profile["email_verified"],
                 phone_verified=profile["phone_verified"],
-                created_at=profile["created_at"],
+                created_at=datetime.fromisoformat(profile["created_at"]),
             ),
         )
+        return _json_response(auth)
     except HTTPException:
         raise
     except Exception as e:
@@ -245,11 +281,11 @@ async def refresh_token(request: RefreshTokenRequest):
         access_token = create_access_token({"sub": user_id, "email": profile["email"]})
         new_refresh_token = create_refresh_token({"sub": user_id})
 
-        return AuthResponse(
+        auth = AuthResponse.model_construct(
             access_token=access_token,
             refresh_token=new_refresh_token,
-            expires_in=settings.jwt_access_token_expire_minutes * 60,
-            user=UserResponse(
+            expires_in=_ACCESS_TOKEN_TTL,
+            user=UserResponse.model_construct(
                 id=profile["id"],
                 email=profile["email"],
                 full_name=profile["full_name"],
@@ -257,11 +293,12 @@ async def refresh_token(request: RefreshTokenRequest):
                 organization_id=profile["organization_id"],
                 email_verified=profile["email_verified"],
                 phone_verified=profile["phone_verified"],
-                created_at=profile["created_at"],
+                created_at=datetime.fromisoformat(profile["created_at"]),
             ),
         )
+        return _json_response(auth)
 
-    except JWTError:
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
         )
@@ -273,8 +310,12 @@ async def refresh_token(request: RefreshTokenRequest):
 
 
 @router.post("/logout", response_model=MessageResponse)
-async def logout(current_user: UserResponse = Depends(get_current_user)):
+async def logout(
+    request: Request,
+    current_user: UserResponse = Depends(get_current_user),
+):
     """Logout current user"""
+    forget_token(_bearer_token(request))
     try:
         # Sign out from Supabase
         await supabase_service.sign_out("")
@@ -319,7 +360,7 @@ async def reset_password(request: ResetPasswordRequest):
 @router.get("/me", response_model=UserResponse)
 async def get_me(current_user: UserResponse = Depends(get_current_user)):
     """Get current user profile"""
-    return current_user
+    return _json_response(current_user)
 
 
 @router.put("/profile", response_model=UserResponse)
@@ -341,6 +382,7 @@ async def update_profile(
             )
 
             if response.data:
+                invalidate_user_cache(current_user.id)
                 profile = response.data[0]
                 return UserResponse(
                     id=profile["id"],
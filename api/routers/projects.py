@@ -3,8 +3,10 @@
 from typing import Optional
 from uuid import UUID
 
-from dependencies import get_current_user
-from fastapi import APIRouter, Depends, Query, status
+import orjson
+from dependencies import conditional_json, get_current_user
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from models.project import (
     Project,
     ProjectCreate,
@@ -14,16 +16,30 @@ from models.project import (
     ProjectUpdate,
 )
 from models.user import User
-from services.project_service import ProjectService
+from services.project_service import PROJECT_LIST, ProjectService
 
-router = APIRouter(prefix="/projects", tags=["Projects"])
+router = APIRouter(
+    prefix="/projects",
+    tags=["Projects"],
+    default_response_class=ORJSONResponse,
+)
+
+_project_service: Optional[ProjectService] = None
+
+
+async def get_project_service() -> ProjectService:
+    """Provide the process-wide ProjectService, created on first use."""
+    global _project_service
+    if _project_service is None:
+        _project_service = ProjectService()
+    return _project_service
 
 
 @router.post("/", response_model=Project, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
     current_user: User = Depends(get_current_user),
-    service: ProjectService = Depends(lambda: ProjectService()),
+    service: ProjectService = Depends(get_project_service),
 ) -> Project:
     """Create a new maintenance project."""
     return await service.create_project(project_data, current_user)
@@ -31,6 +47,7 @@ async def create_project(
 
 @router.get("/", response_model=ProjectListResponse)
 async def list_projects(
+    request: Request,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     search: Optional[str] = Query(None, max_length=100),
@@ -39,8 +56,8 @@ async def list_projects(
     urgency: Optional[str] = None,
     property_id: Optional[UUID] = None,
     current_user: User = Depends(get_current_user),
-    service: ProjectService = Depends(lambda: ProjectService()),
-) -> ProjectListResponse:
+    service: ProjectService = Depends(get_project_service),
+) -> Response:
     """List projects visible to the authenticated user."""
     filters = ProjectFilter(
         search=search,
@@ -57,21 +74,26 @@ async def list_projects(
         per_page=per_page,
     )
 
-    return ProjectListResponse(
-        projects=projects,
-        total=total,
-        page=page,
-        per_page=per_page,
-        has_next=page * per_page < total,
-        has_prev=page > 1,
+    # Serialize the page straight to bytes; ProjectListResponse stays the
+    # documented response_model but is never built and revalidated here.
+    body = orjson.dumps(
+        {
+            "projects": orjson.Fragment(PROJECT_LIST.dump_json(projects)),
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "has_next": page * per_page < total,
+            "has_prev": page > 1,
+        }
     )
+    return conditional_json(request, body)
 
 
 @router.get("/{project_id}", response_model=Project)
 async def get_project(
     project_id: UUID,
     current_user: User = Depends(get_current_user),
-    service: ProjectService = Depends(lambda: ProjectService()),
+    service: ProjectService = Depends(get_project_service),
 ) -> Project:
     """Retrieve a single project by ID."""
     return await service.get_project(project_id, current_user)
@@ -82,7 +104,7 @@ async def update_project(
     project_id: UUID,
     update_payload: ProjectUpdate,
     current_user: User = Depends(get_current_user),
-    service: ProjectService = Depends(lambda: ProjectService()),
+    service: ProjectService = Depends(get_project_service),
 ) -> Project:
     """Update an existing project."""
     return await service.update_project(project_id, update_payload, current_user)
@@ -93,20 +115,25 @@ async def update_project_status(
     project_id: UUID,
     status_payload: ProjectStatusUpdate,
     current_user: User = Depends(get_current_user),
-    service: ProjectService = Depends(lambda: ProjectService()),
+    service: ProjectService = Depends(get_project_service),
 ) -> Project:
     """Transition a project to a new lifecycle status."""
     return await service.update_status(project_id, status_payload.status, current_user)
 
 
-@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{project_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+)
 async def delete_project(
     project_id: UUID,
     current_user: User = Depends(get_current_user),
-    service: ProjectService = Depends(lambda: ProjectService()),
-) -> None:
+    service: ProjectService = Depends(get_project_service),
+) -> Response:
     """Delete a draft project."""
     await service.delete_project(project_id, current_user)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-__all__ = ["router"]
+__all__ = ["router", "get_project_service"]
@@ -5,8 +5,18 @@ import io
 from typing import List, Optional
 from uuid import UUID
 
+import orjson
 from ..dependencies import get_current_user, get_organization_id
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
 from fastapi.responses import StreamingResponse
 from ..models.property import (
     Property,
@@ -26,18 +36,68 @@ from ..models.property import (
     PropertyUpdate,
 )
 from ..models.user import User
-from ..services.property_service import PropertyService
+from ..services.property_service import PROPERTY_LIST, PropertyService
 from ..services.supabase import supabase_service
 from supabase import Client
 
 router = APIRouter(prefix="/properties", tags=["Properties"])
 
+# CSV columns an import cannot do without
+_IMPORT_REQUIRED = ("address", "city", "state", "zip")
+
+_EXPORT_COLUMNS = (
+    "name",
+    "address",
+    "city",
+    "state",
+    "zip",
+    "country",
+    "type",
+    "status",
+    "manager_id",
+    "square_footage",
+    "year_built",
+    "units",
+    "amenities",
+)
+
+
+def _export_row(prop: Property) -> tuple:
+    """One CSV export row, in ``_EXPORT_COLUMNS`` order."""
+    details = prop.details
+    return (
+        prop.name,
+        prop.address,
+        prop.city,
+        prop.state,
+        prop.zip,
+        prop.country,
+        prop.property_type,
+        prop.status,
+        str(prop.manager_id) if prop.manager_id else "",
+        details.square_footage if details else "",
+        details.year_built if details else "",
+        details.units if details else "",
+        ",".join(prop.amenities) if prop.amenities else "",
+    )
 
-def get_supabase_client() -> Client:
-    """Provide the shared Supabase client instance."""
+
+async def get_supabase_client() -> Client:
+    """Provide the shared, process-lifetime Supabase client instance."""
     return supabase_service.client
 
 
+_property_service: Optional[PropertyService] = None
+
+
+async def get_property_service() -> PropertyService:
+    """Provide the process-wide PropertyService, created on first use."""
+    global _property_service
+    if _property_service is None:
+        _property_service = PropertyService()
+    return _property_service
+
+
 # Property CRUD Endpoints
 
 
@@ -45,7 +105,7 @@ def get_supabase_client() -> Client:
 async def create_property(
     property_data: PropertyCreate,
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """Create a new property."""
     # Verify user belongs to organization
@@ -78,7 +138,7 @@ async def list_properties(
     group_id: Optional[UUID] = None,
     include_archived: bool = False,
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """List properties with optional filters."""
     filters = PropertyFilter(
@@ -96,21 +156,26 @@ async def list_properties(
         filters=filters, user_id=current_user.id, page=page, per_page=per_page
     )
 
-    return PropertyListResponse(
-        properties=properties,
-        total=total,
-        page=page,
-        per_page=per_page,
-        has_next=page * per_page < total,
-        has_prev=page > 1,
+    # Serialize the page straight to bytes; PropertyListResponse stays the
+    # documented response_model but is never built and revalidated here.
+    body = orjson.dumps(
+        {
+            "properties": orjson.Fragment(PROPERTY_LIST.dump_json(properties)),
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "has_next": page * per_page < total,
+            "has_prev": page > 1,
+        }
     )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{property_id}", response_model=Property)
 async def get_property(
     property_id: UUID,
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """Get a single property by ID."""
     return await service.get_property(property_id, current_user.id)
@@ -121,34 +186,38 @@ async def update_property(
     property_id: UUID,
     property_data: PropertyUpdate,
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """Update an existing property."""
-    # Get property to check permissions
-    property = await service.get_property(property_id, current_user.id)
-
-    # Check permissions
+    # The permission check is part of the UPDATE's filter, so the usual case
+    # is one round trip; only a miss pays for a lookup to explain it
     if current_user.role == "admin":
         # Admins can update any property in their org
-        if property.organization_id != current_user.organization_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Cannot update property from different organization",
-            )
+        denied = "Cannot update property from different organization"
+        if current_user.organization_id is None:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=denied)
+        scope = {"organization_id": str(current_user.organization_id)}
     elif current_user.role == "manager":
         # Managers can only update assigned properties
-        if property.manager_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Can only update properties assigned to you",
-            )
+        scope = {"manager_id": str(current_user.id)}
+        denied = "Can only update properties assigned to you"
     else:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions to update property",
         )
 
-    return await service.update_property(property_id, property_data, current_user.id)
+    try:
+        return await service.update_property(
+            property_id, property_data, current_user.id, scope=scope
+        )
+    except HTTPException as e:
+        if e.status_code != status.HTTP_404_NOT_FOUND:
+            raise
+
+    # Raises 404 if the property really is missing
+    await service.get_property(property_id, current_user.id)
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=denied)
 
 
 @router.delete("/{property_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -156,7 +225,7 @@ async def delete_property(
     property_id: UUID,
     hard_delete: bool = Query(False),
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """Delete a property (soft delete by default)."""
     # Only admins can delete properties
@@ -166,15 +235,25 @@ async def delete_property(
             detail="Only admins can delete properties",
         )
 
-    # Get property to verify organization
-    property = await service.get_property(property_id, current_user.id)
-    if property.organization_id != current_user.organization_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot delete property from different organization",
+    denied = "Cannot delete property from different organization"
+    if current_user.organization_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=denied)
+
+    # Organization is checked by the DELETE's own filter, as in update_property
+    try:
+        await service.delete_property(
+            property_id,
+            current_user.id,
+            hard_delete,
+            scope={"organization_id": str(current_user.organization_id)},
         )
+        return
+    except HTTPException as e:
+        if e.status_code != status.HTTP_404_NOT_FOUND:
+            raise
 
-    await service.delete_property(property_id, current_user.id, hard_delete)
+    await service.get_property(property_id, current_user.id)
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=denied)
 
 
 # Bulk Operations
@@ -184,7 +263,7 @@ async def delete_property(
 async def bulk_create_properties(
     bulk_data: PropertyBulkCreate,
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """Create multiple properties at once."""
     # Check user role
@@ -215,7 +294,7 @@ async def import_properties(
     skip_errors: bool = Query(True),
     dry_run: bool = Query(False),
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """Import properties from CSV or Excel file."""
     # Check user role
@@ -237,57 +316,93 @@ async def import_properties(
 
     # Process CSV for now (Excel support can be added later)
     if file.filename.endswith(".csv"):
-        csv_reader = csv.DictReader(io.StringIO(content.decode("utf-8")))
+        csv_reader = csv.reader(io.StringIO(content.decode("utf-8")))
+
+        # Resolve column positions once; rows are then plain lists
+        header = next(csv_reader, [])
+        columns = {name: idx for idx, name in enumerate(header)}
+        missing = [name for name in _IMPORT_REQUIRED if name not in columns]
+        address_idx, city_idx, state_idx, zip_idx = (
+            columns.get(name) for name in _IMPORT_REQUIRED
+        )
+        name_idx = columns.get("name", address_idx)
+        country_idx = columns.get("country")
+        type_idx = columns.get("type")
+        width = len(header)
 
-        imported = 0
-        skipped = 0
         errors = []
-        preview = []
+        rows: List[PropertyCreate] = []
+        row_nums: List[int] = []
+        row_num = 1
+
+        def reject(row_num: int, error_msg: str) -> None:
+            errors.append({"row": row_num, "error": error_msg})
+            if not skip_errors:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=error_msg
+                )
 
-        for row_num, row in enumerate(csv_reader, start=2):
+        # Validate every row before touching the database
+        for row in csv_reader:
+            if not row:
+                continue
+            row_num += 1
+            if missing:
+                reject(row_num, f"Row {row_num}: Missing required field '{missing[0]}'")
+                continue
+            if len(row) < width:
+                row += [None] * (width - len(row))
             try:
                 # Map CSV columns to property fields
-                property_data = PropertyCreate(
-                    organization_id=current_user.organization_id,
-                    name=row.get("name", row.get("address", f"Property {row_num}")),
-                    address=row["address"],
-                    city=row["city"],
-                    state=row["state"],
-                    zip=row["zip"],
-                    country=row.get("country", "USA"),
-                    property_type=row.get("type", "other"),
-                    manager_id=current_user.id,  # Default to current user
+                property_data = PropertyCreate.model_validate(
+                    {
+                        "organization_id": current_user.organization_id,
+                        "name": (
+                            row[name_idx]
+                            if name_idx is not None
+                            else f"Property {row_num}"
+                        ),
+                        "address": row[address_idx],
+                        "city": row[city_idx],
+                        "state": row[state_idx],
+                        "zip": row[zip_idx],
+                        "country": (
+                            row[country_idx] if country_idx is not None else "USA"
+                        ),
+                        "property_type": (
+                            row[type_idx] if type_idx is not None else "other"
+                        ),
+                        "manager_id": current_user.id,  # Default to current user
+                    }
                 )
-
-                if dry_run:
-                    preview.append(property_data)
-                else:
-                    await service.create_property(property_data, current_user.id)
-                    imported += 1
-
-            except KeyError as e:
-                error_msg = f"Row {row_num}: Missing required field {str(e)}"
-                errors.append({"row": row_num, "error": error_msg})
-                if not skip_errors:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST, detail=error_msg
-                    )
-                skipped += 1
             except Exception as e:
-                error_msg = f"Row {row_num}: {str(e)}"
-                errors.append({"row": row_num, "error": error_msg})
-                if not skip_errors:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST, detail=error_msg
-                    )
-                skipped += 1
+                reject(row_num, f"Row {row_num}: {str(e)}")
+                continue
+            rows.append(property_data)
+            row_nums.append(row_num)
+
+        imported = 0
+        if rows and not dry_run:
+            # One duplicate lookup and batched INSERTs instead of a round
+            # trip per row; without skip_errors a duplicate aborts before
+            # anything is written, as the first bad row used to
+            result = await service.create_properties(
+                rows,
+                current_user.id,
+                skip_duplicates=False,
+                stop_on_error=not skip_errors,
+            )
+            imported = result["successful"]
+            for error in result["errors"]:
+                failed_row = row_nums[error["index"]]
+                reject(failed_row, f"Row {failed_row}: {error['error']}")
 
         return PropertyImportResponse(
             total_rows=row_num - 1,
             imported=imported,
-            skipped=skipped,
+            skipped=len(errors),
             errors=errors,
-            preview=preview if dry_run else None,
+            preview=rows if dry_run else None,
         )
 
     raise HTTPException(
@@ -301,75 +416,54 @@ async def export_properties(
     format: str = Query("csv", pattern="^(csv|json)$"),
     include_deleted: bool = Query(False),
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """Export properties to CSV or JSON."""
-    # Get all properties
     filters = PropertyFilter(include_archived=include_deleted)
-    properties, _ = await service.get_properties(
-        filters=filters, user_id=current_user.id, page=1, per_page=10000  # Export all
-    )
+    pages = service.iter_properties(filters=filters, user_id=current_user.id)
+    # Fetch the first page up front so a failing query is still a proper
+    # error response rather than a truncated download
+    first_page = await anext(pages, [])
 
     if format == "csv":
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(
-            [
-                "name",
-                "address",
-                "city",
-                "state",
-                "zip",
-                "country",
-                "type",
-                "status",
-                "manager_id",
-                "square_footage",
-                "year_built",
-                "units",
-                "amenities",
-            ]
-        )
 
-        # Write data
-        for prop in properties:
-            writer.writerow(
-                [
-                    prop.name,
-                    prop.address,
-                    prop.city,
-                    prop.state,
-                    prop.zip,
-                    prop.country,
-                    prop.property_type,
-                    prop.status,
-                    str(prop.manager_id) if prop.manager_id else "",
-                    prop.details.square_footage if prop.details else "",
-                    prop.details.year_built if prop.details else "",
-                    prop.details.units if prop.details else "",
-                    ",".join(prop.amenities) if prop.amenities else "",
-                ]
-            )
+        async def csv_chunks():
+            output = io.StringIO()
+            writer = csv.writer(output)
+            writer.writerow(_EXPORT_COLUMNS)
+            page = first_page
+            while page:
+                writer.writerows(map(_export_row, page))
+                # One chunk per page keeps memory at a single page of rows
+                yield output.getvalue().encode()
+                output.seek(0)
+                output.truncate()
+                page = await anext(pages, [])
+            if output.tell():
+                yield output.getvalue().encode()
 
-        output.seek(0)
         return StreamingResponse(
-            io.BytesIO(output.getvalue().encode()),
+            csv_chunks(),
             media_type="text/csv",
             headers={"Content-Disposition": 'attachment; filename="properties.csv"'},
         )
 
     elif format == "json":
-        # Return JSON
-        import json
 
-        json_data = json.dumps(
-            [prop.dict() for prop in properties], default=str, indent=2
-        )
+        async def json_chunks():
+            yield b"["
+            page = first_page
+            separator = b""
+            while page:
+                # pydantic-core encodes the whole page; drop its brackets so
+                # pages join into one array
+                yield separator + PROPERTY_LIST.dump_json(page)[1:-1]
+                separator = b","
+                page = await anext(pages, [])
+            yield b"]"
+
         return StreamingResponse(
-            io.BytesIO(json_data.encode()),
+            json_chunks(),
             media_type="application/json",
             headers={"Content-Disposition": 'attachment; filename="properties.json"'},
         )
@@ -384,7 +478,7 @@ async def export_properties(
 async def create_property_group(
     group_data: PropertyGroupCreate,
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """Create a new property group."""
     # Check permissions
@@ -410,25 +504,19 @@ async def list_property_groups(
     supabase: Client = Depends(get_supabase_client),
 ):
     """List all property groups in the organization."""
-    # Get groups from database
+    # Member counts are embedded by PostgREST, so this is a single round trip
+    # rather than one count query per group
     result = (
         supabase.table("property_groups")
-        .select("*")
+        .select("*, property_group_members(count)")
         .eq("organization_id", str(current_user.organization_id))
         .execute()
     )
 
-    groups = [PropertyGroup(**g) for g in result.data]
-
-    # Get property counts
-    for group in groups:
-        count_result = (
-            supabase.table("property_group_members")
-            .select("property_id", count="exact")
-            .eq("group_id", str(group.id))
-            .execute()
-        )
-        group.property_count = count_result.count or 0
+    groups = []
+    for g in result.data:
+        members = g.pop("property_group_members", None) or [{"count": 0}]
+        groups.append(PropertyGroup(**g, property_count=members[0]["count"]))
 
     return PropertyGroupListResponse(groups=groups, total=len(groups))
 
@@ -438,7 +526,7 @@ async def add_properties_to_group(
     group_id: UUID,
     member_data: PropertyGroupMemberAction,
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
 ):
     """Add properties to a group."""
     # Check permissions
@@ -458,7 +546,7 @@ async def remove_properties_from_group(
     group_id: UUID,
     member_data: PropertyGroupMemberAction,
     current_user: User = Depends(get_current_user),
-    service: PropertyService = Depends(lambda: PropertyService()),
+    service: PropertyService = Depends(get_property_service),
     supabase: Client = Depends(get_supabase_client),
 ):
     """Remove properties from a group."""
@@ -469,8 +557,7 @@ async def remove_properties_from_group(
             detail="Only admins and managers can manage group members",
         )
 
-    # Remove properties
-    for property_id in member_data.property_ids:
-        supabase.table("property_group_members").delete().eq(
-            "group_id", str(group_id)
-        ).eq("property_id", str(property_id)).execute()
+    # Remove properties in one DELETE; the model caps the list at 100 ids
+    supabase.table("property_group_members").delete().eq(
+        "group_id", str(group_id)
+    ).in_("property_id", [str(pid) for pid in member_data.property_ids]).execute()
@@ -12,7 +12,7 @@ from ..services.quote_service import QuoteService
 router = APIRouter(prefix="/quotes", tags=["Quotes"])
 
 
-def get_quote_service() -> QuoteService:
+async def get_quote_service() -> QuoteService:
     """Dependency injector for the quote service."""
 
     return QuoteService()
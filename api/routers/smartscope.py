@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from typing import List, Optional
 from uuid import UUID
 
-from dependencies import get_current_user
-from fastapi import APIRouter, Depends, Query, status
+import orjson
+from dependencies import conditional_json, get_current_user
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from models.smartscope import (
     AccuracyMetrics,
     AnalysisListResponse,
@@ -14,9 +17,29 @@ from models.smartscope import (
     SmartScopeAnalysis,
 )
 from models.user import User
+from pydantic import TypeAdapter
 from services.smartscope_service import SmartScopeService
 
-router = APIRouter(prefix="/smartscope", tags=["SmartScope AI"])
+router = APIRouter(
+    prefix="/smartscope",
+    tags=["SmartScope AI"],
+    default_response_class=ORJSONResponse,
+)
+
+_ANALYSIS_LIST = TypeAdapter(List[SmartScopeAnalysis])
+
+_smartscope_service: Optional[SmartScopeService] = None
+
+
+async def get_smartscope_service() -> SmartScopeService:
+    """Provide the process-wide SmartScopeService, created on first use.
+
+    Sharing it also shares the OpenAI client and its connection pool.
+    """
+    global _smartscope_service
+    if _smartscope_service is None:
+        _smartscope_service = SmartScopeService()
+    return _smartscope_service
 
 
 @router.post(
@@ -25,7 +48,7 @@ router = APIRouter(prefix="/smartscope", tags=["SmartScope AI"])
 async def analyze_project(
     payload: AnalysisRequest,
     current_user: User = Depends(get_current_user),
-    service: SmartScopeService = Depends(lambda: SmartScopeService()),
+    service: SmartScopeService = Depends(get_smartscope_service),
 ) -> SmartScopeAnalysis:
     """Trigger an AI scope analysis for the supplied project context."""
 
@@ -36,7 +59,7 @@ async def analyze_project(
 async def get_analysis(
     analysis_id: UUID,
     current_user: User = Depends(get_current_user),
-    service: SmartScopeService = Depends(lambda: SmartScopeService()),
+    service: SmartScopeService = Depends(get_smartscope_service),
 ) -> SmartScopeAnalysis:
     """Fetch a single SmartScope analysis record."""
 
@@ -46,24 +69,30 @@ async def get_analysis(
 @router.get("/project/{project_id}", response_model=AnalysisListResponse)
 async def list_project_analyses(
     project_id: UUID,
+    request: Request,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_user),
-    service: SmartScopeService = Depends(lambda: SmartScopeService()),
-) -> AnalysisListResponse:
+    service: SmartScopeService = Depends(get_smartscope_service),
+) -> Response:
     """List SmartScope analyses for a project with pagination."""
 
     analyses, total = await service.list_analyses(
         project_id, page=page, per_page=per_page
     )
-    return AnalysisListResponse(
-        analyses=analyses,
-        total=total,
-        page=page,
-        per_page=per_page,
-        has_next=page * per_page < total,
-        has_prev=page > 1,
+    # Serialize the page straight to bytes; AnalysisListResponse stays the
+    # documented response_model but is never built and revalidated here.
+    body = orjson.dumps(
+        {
+            "analyses": orjson.Fragment(_ANALYSIS_LIST.dump_json(analyses)),
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "has_next": page * per_page < total,
+            "has_prev": page > 1,
+        }
     )
+    return conditional_json(request, body)
 
 
 @router.post(
@@ -75,7 +104,7 @@ async def submit_feedback(
     analysis_id: UUID,
     payload: FeedbackRequest,
     current_user: User = Depends(get_current_user),
-    service: SmartScopeService = Depends(lambda: SmartScopeService()),
+    service: SmartScopeService = Depends(get_smartscope_service),
 ) -> None:
     """Submit human feedback to help calibrate SmartScope analyses."""
 
@@ -85,11 +114,11 @@ async def submit_feedback(
 @router.get("/analytics/accuracy", response_model=AccuracyMetrics)
 async def get_accuracy_metrics(
     current_user: User = Depends(get_current_user),
-    service: SmartScopeService = Depends(lambda: SmartScopeService()),
+    service: SmartScopeService = Depends(get_smartscope_service),
 ) -> AccuracyMetrics:
     """Retrieve aggregated SmartScope accuracy metrics."""
 
     return await service.get_accuracy_metrics()
 
 
-__all__ = ["router"]
+__all__ = ["router", "get_smartscope_service"]
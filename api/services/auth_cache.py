@@ -0,0 +1,139 @@
+"""In-process caches for authenticated request state.
+
+Entries are keyed by a SHA-256 digest of the bearer token, never by user or
+URL, so one caller can never be served another caller's data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from uuid import UUID
+
+# Upper bound on how long a cached user may outlive a profile change made
+# on another worker process
+USER_CACHE_MAX_TTL = 300
+
+# Sessions verified against Supabase Auth are re-checked at least this often
+# so a sign-out elsewhere is noticed quickly
+SESSION_CACHE_MAX_TTL = 60
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire after a per-item TTL."""
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Any], bool]) -> None:
+        with self._lock:
+            stale = [key for key, (_, value) in self._data.items() if predicate(value)]
+            for key in stale:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def token_key(token: str) -> str:
+    """Digest a bearer token so raw credentials are never held as keys."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def ttl_until(exp: Optional[float], ceiling: float = USER_CACHE_MAX_TTL) -> float:
+    """Seconds an entry may live: until the token's exp, capped at ceiling."""
+    if exp is None:
+        return ceiling
+    return min(float(exp) - time.time(), ceiling)
+
+
+# sha256(token) -> verified JWT claims. Entries never outlive the token's
+# exp, so a hit is as good as re-running jwt.decode.
+token_cache = TTLCache()
+
+# sha256(token) -> models.user.User
+user_cache = TTLCache()
+
+# sha256(token) -> models.auth.UserResponse, for the /api/auth routes
+profile_cache = TTLCache()
+
+
+def invalidate_user_cache(user_id: UUID | str) -> None:
+    """Drop every cached session for user_id, e.g. after a profile update."""
+    user_id = str(user_id)
+    for cache in (user_cache, profile_cache):
+        cache.discard_where(lambda user: str(user.id) == user_id)
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Size and hit/miss counters of each auth cache, for logs and probes."""
+    return {
+        "token": token_cache.stats(),
+        "user": user_cache.stats(),
+        "profile": profile_cache.stats(),
+    }
+
+
+def forget_token(token: str) -> None:
+    """Drop everything cached for one bearer token, e.g. on logout."""
+    key = token_key(token)
+    for cache in (token_cache, user_cache, profile_cache):
+        cache.discard(key)
+
+
+__all__ = [
+    "SESSION_CACHE_MAX_TTL",
+    "TTLCache",
+    "USER_CACHE_MAX_TTL",
+    "cache_stats",
+    "forget_token",
+    "invalidate_user_cache",
+    "profile_cache",
+    "token_cache",
+    "token_key",
+    "ttl_until",
+    "user_cache",
+]
@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 import base64
 import io
-import json
 import logging
 import time
 from dataclasses import dataclass
@@ -16,6 +15,7 @@ from config import settings
 from models.smartscope import AnalysisRequest, MaterialItem, ScopeItem
 from openai import AsyncOpenAI
 from PIL import Image, ImageEnhance, ImageOps
+from pydantic_core import from_json
 from services.smartscope_config import (
     CATEGORY_SCOPE_TEMPLATES,
     SYSTEM_PROMPT,
@@ -39,12 +39,18 @@ class ProcessedImage:
 class ImagePreprocessor:
     """Fetches and normalises images prior to Vision analysis."""
 
-    def __init__(self, timeout: float = 20.0) -> None:
+    def __init__(
+        self, timeout: float = 20.0, concurrency: Optional[int] = None
+    ) -> None:
         self.timeout = timeout
+        self.concurrency = concurrency or settings.smartscope_fetch_concurrency
 
     async def preprocess(self, image_urls: Iterable[str]) -> List[ProcessedImage]:
-        tasks = [self._process_single(url) for url in image_urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # One pooled client per batch; the semaphore bounds in-flight fetches
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            tasks = [self._process_single(client, semaphore, url) for url in image_urls]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
         processed: List[ProcessedImage] = []
         for result in results:
@@ -52,12 +58,17 @@ class ImagePreprocessor:
                 processed.append(result)
         return processed
 
-    async def _process_single(self, url: str) -> ProcessedImage:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+    async def _process_single(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str
+    ) -> ProcessedImage:
+        async with semaphore:
             response = await client.get(url)
             response.raise_for_status()
 
-        image_bytes = response.content
+        # Decoding and re-encoding is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(self._prepare_image, url, response.content)
+
+    def _prepare_image(self, url: str, image_bytes: bytes) -> ProcessedImage:
         image = Image.open(io.BytesIO(image_bytes))
         image = ImageOps.exif_transpose(image)
         image = image.convert("RGB")
@@ -238,13 +249,13 @@ class OpenAIVisionService:
     def _parse_response(content: str) -> Dict[str, Any]:
         content = content.strip()
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return from_json(content)
+        except ValueError:
             # Attempt to salvage JSON embedded in markdown
             start = content.find("{")
             end = content.rfind("}")
             if start != -1 and end != -1:
-                return json.loads(content[start : end + 1])
+                return from_json(content[start : end + 1])
             raise
 
     @staticmethod
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from models.project import (
     Project,
     ProjectCreate,
@@ -18,6 +19,10 @@ from models.user import User
 from services.supabase import supabase_service
 from supabase import Client
 
+# Validates a whole page of rows in one pydantic-core call; the router dumps
+# pages with the same adapter so the core schema is built once
+PROJECT_LIST = TypeAdapter(List[Project])
+
 
 class ProjectService:
     """Encapsulates project specific data access and validation logic."""
@@ -44,7 +49,7 @@ class ProjectService:
                 detail="Failed to create project",
             )
 
-        return Project(**result.data[0])
+        return Project.model_validate(result.data[0])
 
     async def get_project(self, project_id: UUID, current_user: User) -> Project:
         """Retrieve a single project ensuring the requester has access."""
@@ -66,7 +71,7 @@ class ProjectService:
         property_record = self._fetch_property(UUID(project_record["property_id"]))
         self._verify_property_access(property_record, current_user)
 
-        return Project(**project_record)
+        return Project.model_validate(project_record)
 
     async def list_projects(
         self,
@@ -76,12 +81,20 @@ class ProjectService:
         per_page: int = 20,
     ) -> Tuple[List[Project], int]:
         """Return projects visible to the current user with pagination."""
-        property_ids = self._get_accessible_property_ids(current_user)
-        if not property_ids:
+        if not current_user.organization_id:
             return [], 0
 
-        query = self.supabase.table("projects").select("*", count="exact")
-        query = query.in_("property_id", property_ids)
+        # Scope through an inner join on the parent property so access
+        # filtering and paging happen in one round trip, without shipping
+        # every accessible property id in the query string.
+        query = (
+            self.supabase.table("projects")
+            .select("*, properties!inner(id)", count="exact")
+            .eq("properties.organization_id", str(current_user.organization_id))
+            .is_("properties.deleted_at", None)
+        )
+        if current_user.role == "manager":
+            query = query.eq("properties.manager_id", str(current_user.id))
 
         if filters.status:
             query = query.eq("status", filters.status.value)
@@ -90,8 +103,6 @@ class ProjectService:
         if filters.urgency:
             query = query.eq("urgency", filters.urgency.value)
         if filters.property_id:
-            if str(filters.property_id) not in property_ids:
-                return [], 0
             query = query.eq("property_id", str(filters.property_id))
         if filters.search:
             like = f"%{filters.search}%"
@@ -103,7 +114,7 @@ class ProjectService:
 
         result = query.execute()
 
-        projects = [Project(**record) for record in result.data]
+        projects = PROJECT_LIST.validate_python(result.data)
         total = result.count or 0
 
         return projects, total
@@ -134,7 +145,7 @@ class ProjectService:
                 detail="Failed to update project",
             )
 
-        return Project(**result.data[0])
+        return Project.model_validate(result.data[0])
 
     async def update_status(
         self,
@@ -145,15 +156,16 @@ class ProjectService:
         """Update a project's lifecycle status."""
         await self.get_project(project_id, current_user)
 
+        now_iso = datetime.now(timezone.utc).isoformat()
         update_dict: Dict[str, object] = {
             "status": status_update.value,
-            "updated_at": datetime.utcnow().isoformat(),
+            "updated_at": now_iso,
         }
 
         if status_update == ProjectStatus.OPEN_FOR_BIDS:
-            update_dict["published_at"] = datetime.utcnow().isoformat()
+            update_dict["published_at"] = now_iso
         if status_update in {ProjectStatus.BIDDING_CLOSED, ProjectStatus.CANCELLED}:
-            update_dict["closed_at"] = datetime.utcnow().isoformat()
+            update_dict["closed_at"] = now_iso
 
         result = (
             self.supabase.table("projects")
@@ -168,7 +180,7 @@ class ProjectService:
                 detail="Failed to update project status",
             )
 
-        return Project(**result.data[0])
+        return Project.model_validate(result.data[0])
 
     async def delete_project(self, project_id: UUID, current_user: User) -> None:
         """Delete a project that is still in draft form."""
@@ -242,7 +254,7 @@ class ProjectService:
     def _build_project_insert_dict(
         self, payload: ProjectCreate, current_user: User
     ) -> Dict[str, object]:
-        now_iso = datetime.utcnow().isoformat()
+        now_iso = datetime.now(timezone.utc).isoformat()
         status_value = payload.status.value
 
         if payload.publish:
@@ -314,26 +326,9 @@ class ProjectService:
                 update_dict[key] = value
 
         if update_dict:
-            update_dict["updated_at"] = datetime.utcnow().isoformat()
+            update_dict["updated_at"] = datetime.now(timezone.utc).isoformat()
 
         return update_dict
 
-    def _get_accessible_property_ids(self, current_user: User) -> List[str]:
-        if not current_user.organization_id:
-            return []
-
-        query = (
-            self.supabase.table("properties")
-            .select("id")
-            .eq("organization_id", str(current_user.organization_id))
-            .is_("deleted_at", None)
-        )
-
-        if current_user.role == "manager":
-            query = query.eq("manager_id", str(current_user.id))
-
-        result = query.execute()
-        return [record["id"] for record in result.data]
-
 
-__all__ = ["ProjectService"]
+__all__ = ["PROJECT_LIST", "ProjectService"]
@@ -1,13 +1,15 @@
 """Property service for business logic and database operations."""
 
+import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import httpx
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from ..models.property import (
     Property,
     PropertyBulkCreate,
@@ -28,6 +30,16 @@ from supabase import Client
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole page of rows in one pydantic-core call; the router dumps
+# pages with the same adapter so the core schema is built once
+PROPERTY_LIST = TypeAdapter(List[Property])
+
+# Rows sent per INSERT/IN filter; keeps batch requests under PostgREST limits
+_BATCH_SIZE = 500
+
+# Geocoder requests in flight at once during a bulk create
+_GEOCODE_CONCURRENCY = 8
+
 
 class PropertyService:
     """Service for managing properties."""
@@ -64,24 +76,7 @@ class PropertyService:
                 if coords:
                     data.coordinates = coords
 
-            # Prepare property data
-            property_dict = data.dict(exclude_unset=True)
-
-            # Convert coordinates to PostGIS point
-            if data.coordinates:
-                property_dict["coordinates"] = (
-                    f"POINT({data.coordinates.longitude} {data.coordinates.latitude})"
-                )
-
-            # Convert Pydantic models to dicts
-            if "details" in property_dict:
-                property_dict["details"] = property_dict["details"].dict(
-                    exclude_none=True
-                )
-            if "photos" in property_dict:
-                property_dict["photos"] = [
-                    photo.dict() for photo in property_dict["photos"]
-                ]
+            property_dict = self._property_row(data)
 
             # Create property
             result = self.supabase.table("properties").insert(property_dict).execute()
@@ -100,7 +95,7 @@ class PropertyService:
                 user_id=user_id,
             )
 
-            return Property(**result.data[0])
+            return Property.model_validate(result.data[0])
 
         except HTTPException:
             raise
@@ -185,13 +180,13 @@ class PropertyService:
             offset = (page - 1) * per_page
             query = query.range(offset, offset + per_page - 1)
 
-            # Order by updated_at
-            query = query.order("updated_at", desc=True)
+            # Order by updated_at; id breaks ties so pages never overlap
+            query = query.order("updated_at", desc=True).order("id")
 
             # Execute query
             result = query.execute()
 
-            properties = [Property(**p) for p in result.data]
+            properties = PROPERTY_LIST.validate_python(result.data)
             total = result.count or 0
 
             return properties, total
@@ -203,23 +198,45 @@ class PropertyService:
                 detail=f"Failed to fetch properties: {str(e)}",
             )
 
-    async def get_property(self, property_id: UUID, user_id: UUID) -> Property:
-        """Get a single property by ID."""
+    async def iter_properties(
+        self, filters: PropertyFilter, user_id: UUID, page_size: int = 500
+    ) -> AsyncIterator[List[Property]]:
+        """Yield every property matching ``filters``, one page at a time."""
+        page = 1
+        while True:
+            properties, _ = await self.get_properties(
+                filters=filters, user_id=user_id, page=page, per_page=page_size
+            )
+            if properties:
+                yield properties
+            if len(properties) < page_size:
+                return
+            page += 1
+
+    async def get_property(
+        self,
+        property_id: UUID,
+        user_id: UUID,
+        scope: Optional[Dict[str, str]] = None,
+    ) -> Property:
+        """Get a single property by ID, optionally within ``scope``."""
         try:
-            result = (
+            query = (
                 self.supabase.table("properties")
                 .select("*")
                 .eq("id", str(property_id))
                 .eq("deleted_at", None)
-                .execute()
             )
+            for column, value in (scope or {}).items():
+                query = query.eq(column, value)
+            result = query.execute()
 
             if not result.data:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Property not found"
                 )
 
-            return Property(**result.data[0])
+            return Property.model_validate(result.data[0])
 
         except HTTPException:
             raise
@@ -231,18 +248,29 @@ class PropertyService:
             )
 
     async def update_property(
-        self, property_id: UUID, data: PropertyUpdate, user_id: UUID
+        self,
+        property_id: UUID,
+        data: PropertyUpdate,
+        user_id: UUID,
+        scope: Optional[Dict[str, str]] = None,
     ) -> Property:
-        """Update an existing property."""
-        try:
-            # Get existing property
-            existing = await self.get_property(property_id, user_id)
+        """Update an existing property.
 
+        ``scope`` adds column equality filters to the UPDATE itself, so a
+        property outside the caller's reach is reported as not found without
+        a separate permission lookup.
+        """
+        try:
             # Prepare update data
             update_dict = data.dict(exclude_unset=True, exclude_none=True)
 
-            # Geocode if address changed
-            if any(k in update_dict for k in ["address", "city", "state", "zip"]):
+            # Geocode if address changed; only then is the current row needed
+            if self.geocoding_api_key and any(
+                k in update_dict for k in ["address", "city", "state", "zip"]
+            ):
+                # Scoped, so a caller who may not edit the row never
+                # triggers a paid geocoder call
+                existing = await self.get_property(property_id, user_id, scope)
                 address_parts = [
                     update_dict.get("address", existing.address),
                     update_dict.get("city", existing.city),
@@ -264,17 +292,19 @@ class PropertyService:
                 ]
 
             # Update property
-            result = (
+            query = (
                 self.supabase.table("properties")
                 .update(update_dict)
                 .eq("id", str(property_id))
-                .execute()
+                .is_("deleted_at", "null")
             )
+            for column, value in (scope or {}).items():
+                query = query.eq(column, value)
+            result = query.execute()
 
             if not result.data:
                 raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to update property",
+                    status_code=status.HTTP_404_NOT_FOUND, detail="Property not found"
                 )
 
             # Log audit
@@ -285,7 +315,7 @@ class PropertyService:
                 user_id=user_id,
             )
 
-            return Property(**result.data[0])
+            return Property.model_validate(result.data[0])
 
         except HTTPException:
             raise
@@ -297,31 +327,33 @@ class PropertyService:
             )
 
     async def delete_property(
-        self, property_id: UUID, user_id: UUID, hard_delete: bool = False
+        self,
+        property_id: UUID,
+        user_id: UUID,
+        hard_delete: bool = False,
+        scope: Optional[Dict[str, str]] = None,
     ) -> bool:
-        """Delete a property (soft delete by default)."""
+        """Delete a property (soft delete by default).
+
+        ``scope`` filters the statement the same way as in ``update_property``.
+        """
         try:
+            table = self.supabase.table("properties")
             if hard_delete:
                 # Permanent deletion
-                result = (
-                    self.supabase.table("properties")
-                    .delete()
-                    .eq("id", str(property_id))
-                    .execute()
-                )
+                query = table.delete()
             else:
                 # Soft delete
-                result = (
-                    self.supabase.table("properties")
-                    .update(
-                        {
-                            "deleted_at": datetime.now().isoformat(),
-                            "status": PropertyStatus.ARCHIVED.value,
-                        }
-                    )
-                    .eq("id", str(property_id))
-                    .execute()
+                query = table.update(
+                    {
+                        "deleted_at": datetime.now().isoformat(),
+                        "status": PropertyStatus.ARCHIVED.value,
+                    }
                 )
+            query = query.eq("id", str(property_id)).is_("deleted_at", "null")
+            for column, value in (scope or {}).items():
+                query = query.eq(column, value)
+            result = query.execute()
 
             if not result.data:
                 raise HTTPException(
@@ -351,41 +383,156 @@ class PropertyService:
         self, data: PropertyBulkCreate, user_id: UUID
     ) -> Dict[str, Any]:
         """Create multiple properties at once."""
-        successful = 0
-        failed = 0
+        return await self.create_properties(
+            data.properties, user_id, skip_duplicates=data.skip_duplicates
+        )
+
+    async def create_properties(
+        self,
+        properties: List[PropertyCreate],
+        user_id: UUID,
+        skip_duplicates: bool = True,
+        stop_on_error: bool = False,
+    ) -> Dict[str, Any]:
+        """Insert many properties with batched queries instead of one per row.
+
+        Duplicate addresses are found with one lookup per organization and
+        the rest are inserted ``_BATCH_SIZE`` rows per request; a chunk that
+        fails is retried row by row so only the offending rows are reported.
+        With ``stop_on_error`` a reported duplicate aborts before any INSERT
+        and the first failed row stops further inserts. Error ``index``
+        values are positions in ``properties``.
+        """
         errors = []
         created_ids = []
+        audit_rows = []
 
-        for idx, property_data in enumerate(data.properties):
-            try:
-                property = await self.create_property(property_data, user_id)
-                successful += 1
-                created_ids.append(property.id)
-            except HTTPException as e:
-                failed += 1
-                if (
-                    not data.skip_duplicates
-                    or e.status_code != status.HTTP_409_CONFLICT
-                ):
-                    errors.append(
-                        {
-                            "index": idx,
-                            "address": property_data.address,
-                            "error": e.detail,
-                        }
+        def fail(idx: int, error: str) -> None:
+            errors.append(
+                {"index": idx, "address": properties[idx].address, "error": error}
+            )
+
+        def summary() -> Dict[str, Any]:
+            return {
+                "successful": len(created_ids),
+                "failed": len(properties) - len(created_ids),
+                "errors": errors,
+                "created_ids": created_ids,
+            }
+
+        def insert(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            # Columns a row leaves out keep their defaults, as in a single insert
+            return (
+                self.supabase.table("properties")
+                .insert(rows, default_to_null=False)
+                .execute()
+                .data
+            )
+
+        def created(row: Dict[str, Any], record: Dict[str, Any]) -> None:
+            created_ids.append(record["id"])
+            audit_rows.append(
+                {
+                    "property_id": str(record["id"]),
+                    "action": "created",
+                    "changes": json.dumps(row, default=str),
+                    "performed_by": str(user_id),
+                }
+            )
+
+        # Addresses already in use, per organization
+        addresses: Dict[str, List[str]] = {}
+        for data in properties:
+            addresses.setdefault(str(data.organization_id), []).append(data.address)
+        taken = set()
+        try:
+            for org_id, org_addresses in addresses.items():
+                unique = list(dict.fromkeys(org_addresses))
+                for start in range(0, len(unique), _BATCH_SIZE):
+                    existing = (
+                        self.supabase.table("properties")
+                        .select("address")
+                        .eq("organization_id", org_id)
+                        .in_("address", unique[start : start + _BATCH_SIZE])
+                        .is_("deleted_at", "null")
+                        .execute()
                     )
-            except Exception as e:
-                failed += 1
-                errors.append(
-                    {"index": idx, "address": property_data.address, "error": str(e)}
+                    taken.update((org_id, row["address"]) for row in existing.data)
+        except Exception as e:
+            logger.error(f"Error checking duplicate properties: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to create properties: {str(e)}",
+            )
+
+        pending = []
+        for idx, data in enumerate(properties):
+            key = (str(data.organization_id), data.address)
+            if key in taken:
+                if not skip_duplicates:
+                    fail(idx, "Property with this address already exists")
+                continue
+            # Later rows with the same address conflict with this one
+            taken.add(key)
+            pending.append(idx)
+        if stop_on_error and errors:
+            return summary()
+
+        if self.geocoding_api_key:
+            missing = [idx for idx in pending if not properties[idx].coordinates]
+            # One pooled client for the batch; the semaphore bounds in-flight
+            # geocoder calls however large the import is
+            semaphore = asyncio.Semaphore(_GEOCODE_CONCURRENCY)
+
+            async def geocode(client: httpx.AsyncClient, idx: int):
+                data = properties[idx]
+                async with semaphore:
+                    return await self._geocode_address(
+                        f"{data.address}, {data.city}, {data.state} {data.zip}",
+                        client,
+                    )
+
+            async with httpx.AsyncClient() as client:
+                found = await asyncio.gather(
+                    *(geocode(client, idx) for idx in missing)
                 )
+            for idx, coords in zip(missing, found):
+                if coords:
+                    properties[idx].coordinates = coords
 
-        return {
-            "successful": successful,
-            "failed": failed,
-            "errors": errors,
-            "created_ids": created_ids,
-        }
+        for start in range(0, len(pending), _BATCH_SIZE):
+            chunk = pending[start : start + _BATCH_SIZE]
+            rows = [self._property_row(properties[idx]) for idx in chunk]
+            try:
+                records = insert(rows)
+            except Exception as e:
+                logger.warning(f"Batch insert failed, retrying row by row: {str(e)}")
+            else:
+                for row, record in zip(rows, records):
+                    created(row, record)
+                continue
+
+            # One bad row must not fail its whole chunk
+            for idx, row in zip(chunk, rows):
+                try:
+                    records = insert([row])
+                except Exception as e:
+                    logger.error(f"Error creating property: {str(e)}")
+                    fail(idx, f"Failed to create property: {str(e)}")
+                    if stop_on_error:
+                        break
+                    continue
+                created(row, records[0])
+            if stop_on_error and errors:
+                break
+
+        if audit_rows:
+            try:
+                self.supabase.table("property_audit_log").insert(audit_rows).execute()
+            except Exception as e:
+                logger.warning(f"Failed to log audit: {str(e)}")
+
+        return summary()
 
     # Property Group Methods
 
@@ -471,25 +618,53 @@ class PropertyService:
 
     # Helper Methods
 
-    async def _geocode_address(self, address: str) -> Optional[PropertyCoordinates]:
-        """Geocode an address to coordinates."""
+    @staticmethod
+    def _property_row(data: PropertyCreate) -> Dict[str, Any]:
+        """Convert a PropertyCreate into a ``properties`` insert payload."""
+        property_dict = data.dict(exclude_unset=True)
+
+        # Convert coordinates to PostGIS point
+        if data.coordinates:
+            property_dict["coordinates"] = (
+                f"POINT({data.coordinates.longitude} {data.coordinates.latitude})"
+            )
+
+        # Convert Pydantic models to dicts
+        if "details" in property_dict:
+            property_dict["details"] = property_dict["details"].dict(exclude_none=True)
+        if "photos" in property_dict:
+            property_dict["photos"] = [
+                photo.dict() for photo in property_dict["photos"]
+            ]
+        return property_dict
+
+    async def _geocode_address(
+        self, address: str, client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[PropertyCoordinates]:
+        """Geocode an address to coordinates.
+
+        Pass ``client`` to reuse a pooled connection across many lookups.
+        """
         if not self.geocoding_api_key:
             return None
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://maps.googleapis.com/maps/api/geocode/json",
-                    params={"address": address, "key": self.geocoding_api_key},
-                )
+            if client is None:
+                async with httpx.AsyncClient() as own_client:
+                    return await self._geocode_address(address, own_client)
+
+            response = await client.get(
+                "https://maps.googleapis.com/maps/api/geocode/json",
+                params={"address": address, "key": self.geocoding_api_key},
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    if data["status"] == "OK" and data["results"]:
-                        location = data["results"][0]["geometry"]["location"]
-                        return PropertyCoordinates(
-                            latitude=location["lat"], longitude=location["lng"]
-                        )
+            if response.status_code == 200:
+                data = response.json()
+                if data["status"] == "OK" and data["results"]:
+                    location = data["results"][0]["geometry"]["location"]
+                    return PropertyCoordinates(
+                        latitude=location["lat"], longitude=location["lng"]
+                    )
         except Exception as e:
             logger.warning(f"Geocoding failed for {address}: {str(e)}")
 
@@ -59,7 +59,7 @@ class SmartScopeService:
 
         record = SmartScopeAnalysisCreate(
             project_id=payload.project_id,
-            photo_urls=[str(url) for url in payload.photo_urls],
+            photo_urls=payload.photo_urls,
             primary_issue=analysis_payload.get("primary_issue", ""),
             severity=analysis_payload.get("severity", "Medium"),
             category=payload.category,
@@ -150,10 +150,9 @@ class SmartScopeService:
         )
         result = query.execute()
         records = result.data or []
-        metadata = [self._extract_metadata(record) for record in records]
         analyses = [
-            self._build_analysis_from_record(record, metadata[idx])
-            for idx, record in enumerate(records)
+            self._build_analysis_from_record(record, self._extract_metadata(record))
+            for record in records
         ]
         total = result.count or len(records)
         return analyses, total
@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import Any, Dict, Optional
 
 from config import settings
@@ -8,39 +9,46 @@ logger = logging.getLogger(__name__)
 
 
 class SupabaseService:
-    """Singleton service for Supabase interactions"""
+    """Singleton service for Supabase interactions.
+
+    Clients are created lazily, once per process, and reused for every
+    request so their underlying HTTP connection pools stay warm.
+    """
 
     _instance: Optional["SupabaseService"] = None
     _client: Optional[Client] = None
     _service_client: Optional[Client] = None
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        if (
-            self._client is None
-            and settings.supabase_url_value
-            and settings.supabase_anon_key_value
-        ):
-            self._initialize_clients()
-
     def _initialize_clients(self):
         """Initialize Supabase clients"""
+        with self._lock:
+            if self._client is not None:
+                return
+            self._create_clients()
+
+    def _create_clients(self):
+        """Build both clients; callers must hold _lock"""
         try:
             url = settings.supabase_url_value
             anon_key = settings.supabase_anon_key_value
             if not url or not anon_key:
                 raise ValueError("Supabase configuration missing")
             # Public client (uses anon key)
-            self._client = create_client(url, anon_key)
+            client = create_client(url, anon_key)
 
             # Service client (uses service key) - for admin operations
             service_key = settings.supabase_service_key_value
-            if service_key:
-                self._service_client = create_client(url, service_key)
+            service_client = create_client(url, service_key) if service_key else None
+
+            # Publish both together so no caller sees a half-built pair
+            self._service_client = service_client
+            self._client = client
             logger.info(
                 f"Supabase clients initialized successfully for {settings.supabase_url}"
             )
@@ -48,11 +56,23 @@ class SupabaseService:
             logger.error(f"Failed to initialize Supabase clients: {e}")
             raise
 
+    def _initialize_service_client(self):
+        """Create the service client on its own if the pair was built without it"""
+        with self._lock:
+            if self._service_client is not None:
+                return
+            url = settings.supabase_url_value
+            service_key = settings.supabase_service_key_value
+            if not url or not service_key:
+                raise ValueError("Supabase service configuration missing")
+            self._service_client = create_client(url, service_key)
+
     def force_reinitialize(self):
         """Force reinitialize clients with current settings"""
-        self._client = None
-        self._service_client = None
-        self._initialize_clients()
+        with self._lock:
+            self._client = None
+            self._service_client = None
+            self._create_clients()
 
     @property
     def client(self) -> Client:
@@ -67,12 +87,9 @@ class SupabaseService:
     def service_client(self) -> Client:
         """Get the service Supabase client (admin operations)"""
         if self._service_client is None:
-            if (
-                not settings.supabase_url_value
-                or not settings.supabase_service_key_value
-            ):
-                raise ValueError("Supabase service configuration missing")
-            self._initialize_clients()
+            # Not via _initialize_clients: that is a no-op once the public
+            # client exists, even if the service key was missing back then
+            self._initialize_service_client()
         return self._service_client
 
     async def create_user(
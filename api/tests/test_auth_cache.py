@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from api.services.auth_cache import (
+    TTLCache,
+    forget_token,
+    invalidate_user_cache,
+    profile_cache,
+    token_cache,
+    token_key,
+    ttl_until,
+    user_cache,
+)
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    cache = TTLCache()
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache.set("k", "v", ttl=10)
+    assert cache.get("k") == "v"
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_counts_hits_and_misses():
+    cache = TTLCache()
+    cache.set("k", "v", ttl=60)
+    cache.get("k")
+    cache.get("k")
+    cache.get("missing")
+    assert cache.stats() == {"size": 1, "hits": 2, "misses": 1}
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_until_is_capped_and_respects_exp():
+    assert ttl_until(None) == 300
+    assert ttl_until(time.time() + 3600) == 300
+    assert ttl_until(time.time() - 1) <= 0
+
+
+def test_invalidate_user_cache_drops_all_tokens_for_user():
+    user_id = uuid4()
+    other = SimpleNamespace(id=uuid4())
+    user_cache.set(token_key("t1"), SimpleNamespace(id=user_id), ttl=60)
+    user_cache.set(token_key("t2"), SimpleNamespace(id=user_id), ttl=60)
+    user_cache.set(token_key("t3"), other, ttl=60)
+
+    invalidate_user_cache(user_id)
+
+    assert user_cache.get(token_key("t1")) is None
+    assert user_cache.get(token_key("t2")) is None
+    assert user_cache.get(token_key("t3")) is other
+    user_cache.clear()
+
+
+def test_forget_token_clears_only_that_token():
+    user = SimpleNamespace(id=uuid4())
+    for token in ("t1", "t2"):
+        token_cache.set(token_key(token), {"sub": str(user.id)}, ttl=60)
+        user_cache.set(token_key(token), user, ttl=60)
+        profile_cache.set(token_key(token), user, ttl=60)
+
+    forget_token("t1")
+
+    for cache in (token_cache, user_cache, profile_cache):
+        assert cache.get(token_key("t1")) is None
+        assert cache.get(token_key("t2")) is not None
+        cache.clear()
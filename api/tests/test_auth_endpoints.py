@@ -21,6 +21,24 @@ class TestAuthEndpoints:
         assert data["status"] == "healthy"
         assert "environment" in data
         assert "version" in data
+        assert response.headers["cache-control"] == "public, max-age=5"
+
+    def test_health_endpoint_head(self, client: TestClient):
+        """Test the health check answers HEAD without a body."""
+        response = client.head("/health")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=5"
+        # TestClient drops HEAD bodies, so check what the app declared
+        assert response.headers["content-length"] == "0"
+
+    def test_auth_cache_health_endpoint(self, client: TestClient):
+        """Test the auth cache counters are exposed without caching."""
+        response = client.get("/health/auth-cache")
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {"token", "user", "profile"}
+        assert set(data["token"]) == {"size", "hits", "misses"}
+        assert response.headers["cache-control"] == "no-store"
 
     def test_root_endpoint(self, client: TestClient):
         """Test the root endpoint."""
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from api import routers
+
+EXPECTED_ROUTERS = {"auth", "projects", "properties", "quotes", "smartscope"}
+
+
+def test_routers_package_exports_every_router_once():
+    assert len(routers.__all__) == len(set(routers.__all__))
+    assert set(routers.__all__) == EXPECTED_ROUTERS
+    assert set(routers._ROUTERS) == EXPECTED_ROUTERS
+
+
+def test_routers_package_rejects_unknown_names():
+    with pytest.raises(AttributeError):
+        routers.not_a_router